@@ -3,7 +3,11 @@
 import os
 import sys
 import re
+import copy
+import json
+import hashlib
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -12,14 +16,74 @@ from version_manager import VersionManager
 from i18n import get_translator
 import config
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml-backed, much faster on large values files
+except ImportError:
+    from yaml import SafeLoader
+
 _t = get_translator()
 
 
+def _json_sidecar_path(path: str) -> Path:
+    """JSON copy of a values file in the cache directory, keyed by its absolute path"""
+    digest = hashlib.sha1(str(Path(path).resolve()).encode('utf-8')).hexdigest()[:12]
+    return Path(config.CACHE_DIR) / f"{Path(path).stem}-{digest}.json"
+
+
+def _source_stamp(path: str) -> tuple:
+    """Modification time (ns) and size identifying the current contents of a file"""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=4)
+def _parse_values_file(path: str, stamp: tuple) -> Dict[str, Any]:
+    """
+    Parse a values file as a plain dict (cached per path and source stamp)
+
+    A JSON sidecar in the cache directory is preferred while the stamp recorded in it
+    matches the source exactly, since json parses much faster than YAML. It is only
+    written when the data survives a JSON round trip unchanged (e.g. no dates or
+    non-string keys).
+    """
+    sidecar = _json_sidecar_path(path)
+    try:
+        cached = json.loads(sidecar.read_text(encoding='utf-8'))
+        if cached.get('source') == list(stamp):
+            return cached['data']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    try:
+        encoded = json.dumps({'source': list(stamp), 'data': data})
+        if json.loads(encoded)['data'] == data:
+            sidecar.parent.mkdir(exist_ok=True)
+            sidecar.write_text(encoded, encoding='utf-8')
+    except (OSError, TypeError, ValueError):
+        pass
+    return data
+
+
+def load_values(path: str) -> Dict[str, Any]:
+    """Load values as a plain dict, reusing the parsed file while it is unchanged"""
+    return copy.deepcopy(_parse_values_file(path, _source_stamp(path)))
+
+
+def load_values_subset(path: str, keys) -> Dict[str, Any]:
+    """Load only the given top-level keys, copying just those subtrees"""
+    data = _parse_values_file(path, _source_stamp(path))
+    return {key: copy.deepcopy(data[key]) for key in keys if key in data}
+
+
 class ValuesGenerator:
     """Values generator"""
 
-    def __init__(self, source_file: str, version: Optional[str] = None, chart_version: Optional[str] = None):
-        """Initialize"""
+    def __init__(self, source_file: str, version: Optional[str] = None, chart_version: Optional[str] = None,
+                 values: Optional[Dict[str, Any]] = None):
+        """Initialize (pass pre-parsed values to skip loading the template document)"""
         self.source_file = source_file
         self.values = {}
         self.yaml_data = None  # ruamel.yaml data object (preserves comments and format)
@@ -27,7 +91,11 @@ class ValuesGenerator:
         self.version = version or "3.x"  # Default version
         self.chart_version = chart_version  # Helm Chart version
         self.version_modules = VersionManager.get_version_modules(self.version)
-        self.load_template()
+        if values is not None:
+            # save() reloads the source document when none was loaded here
+            self.values = values
+        else:
+            self.load_template()
 
     def load_template(self):
         """Load template file"""
@@ -47,8 +115,7 @@ class ValuesGenerator:
                 self.yaml_data = self.yaml_loader.load(f)
 
             # Also load as standard dict for configuration logic
-            with open(self.source_file, 'r', encoding='utf-8') as f:
-                self.values = yaml.safe_load(f)
+            self.values = load_values(self.source_file)
 
             print_success(f"{_t('template_loaded')}: {self.source_file} ({_t('using_ruamel')})")
 
@@ -210,8 +277,7 @@ class ValuesGenerator:
         content = self.template_content
 
         # Get original values for comparison
-        with open(self.source_file, 'r', encoding='utf-8') as f:
-            original_data = yaml.safe_load(f)
+        original_data = load_values(self.source_file)
 
         # Find all values that need updating
         def find_changes(new_dict: dict, old_dict: dict, path: str = ""):
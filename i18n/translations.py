@@ -1,5 +1,6 @@
 """Translation strings and language management"""
 
+from functools import lru_cache
 from typing import Dict, Optional
 
 # Translation strings
@@ -126,6 +127,8 @@ TRANSLATIONS = {
         'auto_generate_openssl': 'Will be auto-generated using openssl rand -base64 42',
         'inner_api_key_desc': 'innerApiKey is the secret key for internal API calls',
         'generated': 'Generated',
+        'kept_existing': 'Kept existing',
+        'keep_existing_secret': 'Keep the existing value of',
         'domain_config': 'Domain Configuration',
         'empty_use_same': 'If empty, the same domain will be used',
         'console_api_domain': 'Console API Domain',
@@ -288,6 +291,7 @@ TRANSLATIONS = {
         'invalid_replica_count': 'Invalid replica count',
         'using_default': 'using default',
         'service_disabled_skip_replica': 'Service disabled, skipping replica configuration',
+        'no_services_for_replicas': 'No replica-configurable services found in template, skipping',
 
         'tls_config': 'TLS Configuration',
         'tls_config_affects': 'TLS configuration affects internal service communication and CORS settings',
@@ -657,6 +661,8 @@ TRANSLATIONS = {
         'auto_generate_openssl': '将使用 openssl rand -base64 42 自动生成',
         'inner_api_key_desc': 'innerApiKey 用于内部API调用的密钥',
         'generated': '已生成',
+        'kept_existing': '保留现有',
+        'keep_existing_secret': '保留现有的',
         'domain_config': '域名配置',
         'empty_use_same': '如果为空，将使用相同域名',
         'console_api_domain': 'Console API 域名',
@@ -826,6 +832,7 @@ TRANSLATIONS = {
         'invalid_replica_count': '无效的副本数量',
         'using_default': '使用默认值',
         'service_disabled_skip_replica': '服务已禁用，跳过副本配置',
+        'no_services_for_replicas': '模板中没有可配置副本的服务，跳过',
 
         'tls_config': 'TLS 配置',
         'tls_config_affects': 'TLS 配置影响内部服务通信和 CORS 设置',
@@ -961,6 +968,9 @@ TRANSLATIONS = {
 # Current language (default: English)
 _current_language = 'en'
 
+# Resolved strings keyed by (language, key), cleared on language switch
+_translation_cache: Dict[tuple, str] = {}
+
 
 class Translations:
     """Translation manager"""
@@ -969,8 +979,11 @@ class Translations:
     def get(key: str, language: Optional[str] = None, **kwargs) -> str:
         """Get translated string"""
         lang = language or _current_language
-        translations = TRANSLATIONS.get(lang, TRANSLATIONS['en'])
-        text = translations.get(key, key)
+        cache_key = (lang, key)
+        text = _translation_cache.get(cache_key)
+        if text is None:
+            translations = TRANSLATIONS.get(lang, TRANSLATIONS['en'])
+            text = _translation_cache.setdefault(cache_key, translations.get(key, key))
 
         # Format with kwargs if provided
         if kwargs:
@@ -986,9 +999,15 @@ class Translations:
         """Get available languages"""
         return list(TRANSLATIONS.keys())
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear memoized translations"""
+        _translation_cache.clear()
+
 
+@lru_cache(maxsize=None)
 def get_translator(language: Optional[str] = None):
-    """Get translator function"""
+    """Get translator function (one shared closure per language argument)"""
     def translate(key: str, **kwargs) -> str:
         return Translations.get(key, language, **kwargs)
     return translate
@@ -1001,6 +1020,7 @@ def set_language(language: str):
         _current_language = language
     else:
         _current_language = 'en'
+    Translations.clear_cache()
 
 
 def get_language() -> str:
@@ -36,22 +36,31 @@ __all__ = [
 ]
 
 # Auto-discover and import all feature modules
+_DISCOVERED = False
+
+
 def _discover_features():
-    """Automatically discover and import all feature modules"""
+    """Automatically discover and import all feature modules (once per process)"""
+    global _DISCOVERED
+    if _DISCOVERED:
+        return
+
     import os
     import importlib
-    from pathlib import Path
 
-    features_dir = Path(__file__).parent
-    for file in features_dir.glob("*.py"):
-        if file.name.startswith("_") or file.name == "base.py":
-            continue
-        module_name = file.stem
+    features_dir = os.path.dirname(os.path.abspath(__file__))
+    module_names = sorted(
+        entry.name[:-3]
+        for entry in os.scandir(features_dir)
+        if entry.is_file() and entry.name.endswith(".py")
+        and not entry.name.startswith("_") and entry.name != "base.py"
+    )
+    for module_name in module_names:
         try:
             importlib.import_module(f".{module_name}", package=__name__)
         except ImportError as e:
             print(f"Warning: Failed to import feature module {module_name}: {e}")
+    _DISCOVERED = True
 
 # Discover features on module load
 _discover_features()
-
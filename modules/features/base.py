@@ -9,10 +9,11 @@ This module provides the core infrastructure for managing version-specific featu
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Callable, Any, Type
-from functools import wraps
+from functools import lru_cache, wraps
 import re
 
 
+@lru_cache(maxsize=256)
 def parse_version(version_str: str) -> tuple:
     """
     Parse version string into comparable tuple
@@ -25,6 +26,8 @@ def parse_version(version_str: str) -> tuple:
 
     Pre-release versions are considered less than release versions:
     3.6.0-alpha.1 < 3.6.0-beta.1 < 3.6.0-rc.1 < 3.6.0
+
+    Results are cached since the same handful of versions is parsed repeatedly.
     """
     if not version_str:
         return (0, 0, 0, "", 0)
@@ -80,6 +83,12 @@ def compare_versions(v1: str, v2: str) -> int:
     return 0
 
 
+def version_at_least(version: str, min_version: str) -> bool:
+    """Check if version >= min_version (the common single-bound case)"""
+    return parse_version(version) >= parse_version(min_version)
+
+
+@lru_cache(maxsize=256)
 def version_satisfies(version: str, min_version: Optional[str] = None, max_version: Optional[str] = None) -> bool:
     """
     Check if version satisfies the given constraints
@@ -92,9 +101,11 @@ def version_satisfies(version: str, min_version: Optional[str] = None, max_versi
     Returns:
         True if version satisfies constraints
     """
+    if not max_version:
+        return not min_version or version_at_least(version, min_version)
     if min_version and compare_versions(version, min_version) < 0:
         return False
-    if max_version and compare_versions(version, max_version) > 0:
+    if compare_versions(version, max_version) > 0:
         return False
     return True
 
@@ -147,6 +158,8 @@ class FeatureRegistry:
     """
 
     _features: Dict[str, List[Type[Feature]]] = {}
+    # get_all_features results per chart version, reset whenever registrations change
+    _all_features_cache: Dict[str, Dict[str, List[Feature]]] = {}
 
     @classmethod
     def register(cls, feature_class: Type[Feature], module: str = "") -> None:
@@ -160,6 +173,7 @@ class FeatureRegistry:
         if module not in cls._features:
             cls._features[module] = []
         cls._features[module].append(feature_class)
+        cls._all_features_cache.clear()
 
     @classmethod
     def get_features_for_module(cls, module: str, chart_version: str) -> List[Feature]:
@@ -190,7 +204,12 @@ class FeatureRegistry:
 
         Returns:
             Dict mapping module names to lists of applicable features
+            (cached per version; callers should not mutate it)
         """
+        cached = cls._all_features_cache.get(chart_version)
+        if cached is not None:
+            return cached
+
         result = {}
         for module, feature_classes in cls._features.items():
             applicable = []
@@ -200,12 +219,14 @@ class FeatureRegistry:
                     applicable.append(feature)
             if applicable:
                 result[module] = applicable
+        cls._all_features_cache[chart_version] = result
         return result
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered features (useful for testing)"""
         cls._features.clear()
+        cls._all_features_cache.clear()
 
 
 def register_feature(
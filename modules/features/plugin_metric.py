@@ -9,6 +9,11 @@ from .base import Feature, register_feature
 from utils import print_section, print_info, print_success, print_warning, prompt, prompt_choice, prompt_yes_no
 from i18n import get_translator
 
+# Metric sources accepted by plugin_manager.metric.source
+_METRIC_DISABLED = "disabled"
+_METRIC_CADVISOR = "cadvisor"
+_METRIC_PROMETHEUS = "prometheus"
+
 
 @register_feature(
     min_version="3.7.0",
@@ -50,14 +55,14 @@ class PluginMetricFeature(Feature):
         # Select metric source
         print_info("")
         print_info(_t('plugin_metric_source_options'))
-        print_info(f"  • disabled - {_t('plugin_metric_disabled_desc')}")
-        print_info(f"  • cadvisor - {_t('plugin_metric_cadvisor_desc')}")
-        print_info(f"  • prometheus - {_t('plugin_metric_prometheus_desc')}")
+        print_info(f"  • {_METRIC_DISABLED} - {_t('plugin_metric_disabled_desc')}")
+        print_info(f"  • {_METRIC_CADVISOR} - {_t('plugin_metric_cadvisor_desc')}")
+        print_info(f"  • {_METRIC_PROMETHEUS} - {_t('plugin_metric_prometheus_desc')}")
 
         metric_source = prompt_choice(
             _t('plugin_metric_source'),
-            ["disabled", "cadvisor", "prometheus"],
-            default=generator.values.get('plugin_manager', {}).get('metric', {}).get('source', 'disabled')
+            [_METRIC_DISABLED, _METRIC_CADVISOR, _METRIC_PROMETHEUS],
+            default=generator.values.get('plugin_manager', {}).get('metric', {}).get('source', _METRIC_DISABLED)
         )
 
         # Ensure metric section exists
@@ -66,7 +71,7 @@ class PluginMetricFeature(Feature):
 
         generator.values['plugin_manager']['metric']['source'] = metric_source
 
-        if metric_source == "cadvisor":
+        if metric_source == _METRIC_CADVISOR:
             print_warning(_t('cadvisor_cluster_role_warning'))
 
             # Configure scrape settings
@@ -95,7 +100,7 @@ class PluginMetricFeature(Feature):
                 )
                 generator.values['plugin_manager']['metric']['scrape']['retainPeriod'] = retain_period
 
-        elif metric_source == "prometheus":
+        elif metric_source == _METRIC_PROMETHEUS:
             print_info(_t('prometheus_external_required'))
             print_info(_t('prometheus_config_in_infrastructure'))
 
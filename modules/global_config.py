@@ -1,7 +1,7 @@
 """Global configuration module"""
 
 from utils import (
-    print_header, print_section, print_info, print_success, print_warning, print_error,
+    print_header, print_section, print_info, print_block, SEPARATOR, print_success, print_warning, print_error,
     prompt, prompt_choice, prompt_yes_no, generate_secret
 )
 from version_manager import VersionManager
@@ -11,6 +11,16 @@ from modules.features.base import version_satisfies
 
 _t = get_translator()
 
+# RAG ETL types accepted by global.rag.etlType
+_ETL_DIFY = "dify"
+_ETL_UNSTRUCTURED = "Unstructured"
+
+# ETL type -> (unstructured.enabled, translation key of the notice)
+_UNSTRUCTURED_FOR_ETL = {
+    _ETL_DIFY: (False, 'auto_disabled_unstructured'),
+    _ETL_UNSTRUCTURED: (True, 'auto_enabled_unstructured'),
+}
+
 
 def configure_global(generator):
     """Configure global settings"""
@@ -20,15 +30,16 @@ def configure_global(generator):
 
     # Secret Keys - All keys are auto-generated as per comments
     print_section(_t('secret_config'))
+    generated_label = _t('generated')
     print_info(_t('app_secret_key_desc'))
     print_info(_t('auto_generate_openssl'))
     generator.values['global']['appSecretKey'] = generate_secret(42)
-    print_success(f"{_t('generated')} appSecretKey: {generator.values['global']['appSecretKey'][:20]}...")
+    print_success(f"{generated_label} appSecretKey: {generator.values['global']['appSecretKey'][:20]}...")
 
     print_info(_t('inner_api_key_desc'))
     print_info(_t('auto_generate_openssl'))
     generator.values['global']['innerApiKey'] = generate_secret(42)
-    print_success(f"{_t('generated')} innerApiKey: {generator.values['global']['innerApiKey'][:20]}...")
+    print_success(f"{generated_label} innerApiKey: {generator.values['global']['innerApiKey'][:20]}...")
 
     # Domain configuration
     print_section(_t('domain_config'))
@@ -96,36 +107,35 @@ def configure_global(generator):
     print_section(_t('rag_config'))
     rag_etl_type = prompt_choice(
         _t('rag_etl_type'),
-        ["dify", "Unstructured"],
-        default="dify"
+        [_ETL_DIFY, _ETL_UNSTRUCTURED],
+        default=_ETL_DIFY
     )
     generator.values['global']['rag']['etlType'] = rag_etl_type
 
     # Relationship: If dify is selected, disable unstructured module
-    if rag_etl_type == "dify":
-        generator.values['unstructured']['enabled'] = False
-        print_info(_t('auto_disabled_unstructured'))
-    else:
-        generator.values['unstructured']['enabled'] = True
-        print_info(_t('auto_enabled_unstructured'))
+    unstructured_enabled, notice_key = _UNSTRUCTURED_FOR_ETL[rag_etl_type]
+    generator.values['unstructured']['enabled'] = unstructured_enabled
+    print_info(_t(notice_key))
 
     # Keyword data source type configuration - Add detailed description
     print_section(_t('keyword_data_source'))
-    print_info("=" * 60)
-    print_info(f"{_t('important_note')}: {_t('keyword_data_source')}")
-    print_info("=" * 60)
-    print_info(_t('keyword_data_source_desc'))
-    print_info("")
-    print_info(_t('option_explanation') + ":")
-    print_info(f"  • {_t('option_object_storage')}")
-    print_info(_t('option_object_storage_desc'))
-    print_info(f"    - {_t('needs_object_storage')}")
-    print_info("")
-    print_info(f"  • {_t('option_database')}")
-    print_info(_t('option_database_desc'))
-    print_info(f"    - {_t('uses_postgresql')}")
-    print_info("=" * 60)
-    print_info("")
+    print_block(
+        SEPARATOR,
+        f"{_t('important_note')}: {_t('keyword_data_source')}",
+        SEPARATOR,
+        _t('keyword_data_source_desc'),
+        "",
+        _t('option_explanation') + ":",
+        f"  • {_t('option_object_storage')}",
+        _t('option_object_storage_desc'),
+        f"    - {_t('needs_object_storage')}",
+        "",
+        f"  • {_t('option_database')}",
+        _t('option_database_desc'),
+        f"    - {_t('uses_postgresql')}",
+        SEPARATOR,
+        "",
+    )
     generator.values['global']['rag']['keywordDataSourceType'] = prompt_choice(
         _t('select_keyword_source'),
         ["object_storage", "database"],
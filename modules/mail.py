@@ -2,9 +2,8 @@
 
 from utils import (
     print_header, print_section, print_info, print_success, print_warning, print_error,
-    prompt, prompt_choice, prompt_yes_no, generate_secret
+    prompt, prompt_int, prompt_choice, prompt_yes_no, generate_secret
 )
-from version_manager import VersionManager
 from i18n import get_translator
 
 _t = get_translator()
@@ -40,27 +39,26 @@ def configure_mail(generator):
                 required=False
             )
         elif mail_type == "smtp":
-            generator.values['mail']['smtp']['server'] = prompt(
+            smtp = generator.values['mail']['smtp']
+            smtp['server'] = prompt(
                 _t('smtp_server'),
                 required=True
             )
-            port = prompt(_t('smtp_port'), default="587", required=False)
-            try:
-                generator.values['mail']['smtp']['port'] = int(port)
-            except ValueError:
-                generator.values['mail']['smtp']['port'] = 587
+            smtp['port'] = prompt_int(_t('smtp_port'), 587)
 
-            generator.values['mail']['smtp']['username'] = prompt(
-                _t('smtp_username'),
-                required=True
-            )
-            generator.values['mail']['smtp']['password'] = prompt(
-                _t('smtp_password'),
-                required=True
-            )
-            generator.values['mail']['smtp']['useTLS'] = prompt_yes_no(
-                _t('use_tls'),
-                default=False
-            )
+            smtp.update({
+                'username': prompt(
+                    _t('smtp_username'),
+                    required=True
+                ),
+                'password': prompt(
+                    _t('smtp_password'),
+                    required=True
+                ),
+                'useTLS': prompt_yes_no(
+                    _t('use_tls'),
+                    default=False
+                ),
+            })
 
     # ==================== 模块 5: 插件配置 ====================
@@ -2,13 +2,21 @@
 
 from utils import (
     print_header, print_section, print_info, print_success, print_warning, print_error,
-    prompt, prompt_choice, prompt_yes_no, generate_secret
+    prompt, prompt_or_default, prompt_choice, prompt_yes_no, generate_secret
 )
 from version_manager import VersionManager
 from i18n import get_translator
 
 _t = get_translator()
 
+# Known ingress classes -> (install warning key, optional install hint key)
+_INGRESS_CLASS_NOTES = {
+    "nginx": ('ensure_nginx_installed', 'nginx_install_method'),
+    "alb": ('ensure_alb_installed', 'alb_install_method'),
+    "traefik": ('ensure_traefik_installed', None),
+    "istio": ('ensure_istio_installed', None),
+}
+
 
 def configure_networking(generator):
     """Configure networking"""
@@ -36,28 +44,18 @@ def configure_networking(generator):
     print_info(_t('select_ingress_controller_type'))
     ingress_class_choice = prompt_choice(
         _t('ingress_class_name'),
-        ["nginx", "alb", "traefik", "istio", _t('other')],
+        [*_INGRESS_CLASS_NOTES, _t('other')],
         default="nginx"
     )
 
-    if ingress_class_choice == "nginx":
-        generator.values['ingress']['className'] = "nginx"
-        print_info("")
-        print_warning(_t('ensure_nginx_installed'))
-        print_info(_t('nginx_install_method'))
-    elif ingress_class_choice == "alb":
-        generator.values['ingress']['className'] = "alb"
-        print_info("")
-        print_warning(_t('ensure_alb_installed'))
-        print_info(_t('alb_install_method'))
-    elif ingress_class_choice == "traefik":
-        generator.values['ingress']['className'] = "traefik"
-        print_info("")
-        print_warning(_t('ensure_traefik_installed'))
-    elif ingress_class_choice == "istio":
-        generator.values['ingress']['className'] = "istio"
+    class_notes = _INGRESS_CLASS_NOTES.get(ingress_class_choice)
+    if class_notes:
+        warning_key, info_key = class_notes
+        generator.values['ingress']['className'] = ingress_class_choice
         print_info("")
-        print_warning(_t('ensure_istio_installed'))
+        print_warning(_t(warning_key))
+        if info_key:
+            print_info(_t(info_key))
     else:
         # Other option, manual input
         generator.values['ingress']['className'] = prompt(
@@ -69,9 +67,7 @@ def configure_networking(generator):
     # Ingress TLS Configuration - Linked with global TLS
     if use_tls:
         print_info(_t('global_tls_enabled_ingress_note'))
-        ingress_tls = prompt_yes_no(_t('config_tls_in_ingress'), default=True)
-    else:
-        ingress_tls = prompt_yes_no(_t('config_tls_in_ingress'), default=False)
+    ingress_tls = prompt_yes_no(_t('config_tls_in_ingress'), default=use_tls)
 
     if ingress_tls:
         print_info(_t('tls_cert_config'))
@@ -79,32 +75,11 @@ def configure_networking(generator):
         print_info(_t('manual_tls_secret_option'))
 
         # TLS configuration example
-        tls_hosts = prompt(
-            _t('tls_hosts_list'),
-            default="",
-            required=False
-        )
-
-        if tls_hosts:
-            hosts_list = [h.strip() for h in tls_hosts.split(',') if h.strip()]
-            if hosts_list:
-                # Create TLS configuration
-                if 'tls' not in generator.values['ingress'] or not isinstance(generator.values['ingress']['tls'], list):
-                    generator.values['ingress']['tls'] = []
-
-                generator.values['ingress']['tls'].append({
-                    'hosts': hosts_list,
-                    'secretName': prompt(
-                        _t('tls_secret_name'),
-                        default=f"{hosts_list[0]}-tls",
-                        required=False
-                    ) or f"{hosts_list[0]}-tls"
-                })
+        _capture_tls_hosts(generator, _t('tls_hosts_list'))
 
         # Add cert-manager annotation example
         if prompt_yes_no(_t('use_cert_manager'), default=False):
-            if 'annotations' not in generator.values['ingress']:
-                generator.values['ingress']['annotations'] = {}
+            annotations = generator.values['ingress'].setdefault('annotations', {})
 
             cluster_issuer = prompt(
                 _t('cluster_issuer_name'),
@@ -112,7 +87,7 @@ def configure_networking(generator):
                 required=False
             )
             if cluster_issuer:
-                generator.values['ingress']['annotations']['cert-manager.io/cluster-issuer'] = cluster_issuer
+                annotations['cert-manager.io/cluster-issuer'] = cluster_issuer
                 print_success(f"{_t('cert_manager_configured')}: {cluster_issuer}")
 
     # Check TLS consistency
@@ -121,24 +96,7 @@ def configure_networking(generator):
         if prompt_yes_no(_t('enable_ingress_tls_now'), default=True):
             ingress_tls = True
             # Reconfigure TLS
-            tls_hosts = prompt(
-                _t('tls_hosts_list_comma'),
-                default="",
-                required=False
-            )
-            if tls_hosts:
-                hosts_list = [h.strip() for h in tls_hosts.split(',') if h.strip()]
-                if hosts_list:
-                    if 'tls' not in generator.values['ingress'] or not isinstance(generator.values['ingress']['tls'], list):
-                        generator.values['ingress']['tls'] = []
-                    generator.values['ingress']['tls'].append({
-                        'hosts': hosts_list,
-                        'secretName': prompt(
-                            _t('tls_secret_name'),
-                            default=f"{hosts_list[0]}-tls",
-                            required=False
-                        ) or f"{hosts_list[0]}-tls"
-                    })
+            _capture_tls_hosts(generator, _t('tls_hosts_list_comma'))
 
     if not use_tls and ingress_tls:
         print_warning(_t('ingress_tls_enabled_global_not_warning'))
@@ -149,3 +107,27 @@ def configure_networking(generator):
     # useIpAsHost configuration - Enterprise edition doesn't support, fixed to False
     generator.values['ingress']['useIpAsHost'] = False
 
+
+def _capture_tls_hosts(generator, hosts_prompt: str):
+    """Prompt for TLS hosts and append an ingress TLS entry for them"""
+    tls_hosts = prompt(
+        hosts_prompt,
+        default="",
+        required=False
+    )
+    if not tls_hosts:
+        return
+
+    hosts_list = [host for host in (h.strip() for h in tls_hosts.split(',')) if host]
+    if not hosts_list:
+        return
+
+    # Create TLS configuration
+    tls_list = generator.values['ingress'].get('tls')
+    if not isinstance(tls_list, list):
+        tls_list = generator.values['ingress']['tls'] = []
+
+    tls_list.append({
+        'hosts': hosts_list,
+        'secretName': prompt_or_default(_t('tls_secret_name'), f"{hosts_list[0]}-tls")
+    })
@@ -4,12 +4,25 @@ from utils import (
     print_header, print_section, print_info, print_success, print_warning, print_error,
     prompt, prompt_choice, prompt_yes_no, generate_secret
 )
-from version_manager import VersionManager
 from i18n import get_translator
-from modules.features import apply_features
 
 _t = get_translator()
 
+# Services with replica configuration
+# Note: workerBeat does not have replicas (it's a singleton scheduler)
+_SERVICES_WITH_REPLICAS = (
+    'api', 'worker', 'web', 'sandbox', 'enterprise', 'enterpriseAudit',
+    'enterpriseFrontend', 'ssrfProxy', 'unstructured', 'plugin_daemon',
+    'plugin_controller', 'plugin_connector', 'plugin_manager',
+)
+
+# Auto-generated enterprise secrets: (values key, length, description key, display name)
+_ENTERPRISE_SECRETS = (
+    ('appSecretKey', 42, 'enterprise_app_secret_key_auto', 'Enterprise appSecretKey'),
+    ('adminAPIsSecretKeySalt', 42, 'admin_apis_secret_key_salt_auto', 'adminAPIsSecretKeySalt'),
+    ('passwordEncryptionKey', 32, 'password_encryption_key_auto', 'passwordEncryptionKey'),
+)
+
 
 def configure_services(generator):
     """Configure services"""
@@ -19,18 +32,19 @@ def configure_services(generator):
     if generator.values.get('enterprise', {}).get('enabled', True):
         print_section(_t('enterprise_service_config'))
 
-        # All keys are auto-generated as per comments
-        print_info(_t('enterprise_app_secret_key_auto'))
-        generator.values['enterprise']['appSecretKey'] = generate_secret(42)
-        print_success(f"{_t('generated')} Enterprise appSecretKey: {generator.values['enterprise']['appSecretKey'][:20]}...")
-
-        print_info(_t('admin_apis_secret_key_salt_auto'))
-        generator.values['enterprise']['adminAPIsSecretKeySalt'] = generate_secret(42)
-        print_success(f"{_t('generated')} adminAPIsSecretKeySalt: {generator.values['enterprise']['adminAPIsSecretKeySalt'][:20]}...")
-
-        print_info(_t('password_encryption_key_auto'))
-        generator.values['enterprise']['passwordEncryptionKey'] = generate_secret(32)
-        print_success(f"{_t('generated')} passwordEncryptionKey: {generator.values['enterprise']['passwordEncryptionKey'][:20]}...")
+        # Keys are auto-generated as per comments; an existing value is kept only if the user confirms,
+        # since the source is normally the chart template and its values must not ship to production
+        enterprise = generator.values['enterprise']
+        generated_label = _t('generated')
+        kept_label = _t('kept_existing')
+        keep_prompt = _t('keep_existing_secret')
+        for key, length, desc_key, label in _ENTERPRISE_SECRETS:
+            print_info(_t(desc_key))
+            if enterprise.get(key) and prompt_yes_no(f"{keep_prompt} {label}", default=False):
+                print_info(f"{kept_label} {label}: {enterprise[key][:20]}...")
+                continue
+            enterprise[key] = generate_secret(length)
+            print_success(f"{generated_label} {label}: {enterprise[key][:20]}...")
 
         # License mode selection (online/offline)
         # Note: licenseServer URL is not set - users should configure it manually in values.yaml
@@ -49,54 +63,63 @@ def configure_services(generator):
     print_section(_t('service_replica_config'))
     print_info(_t('service_replica_config_note'))
 
-    # Services with replica configuration
-    # Note: workerBeat does not have replicas (it's a singleton scheduler)
-    services_with_replicas = [
-        'api', 'worker', 'web', 'sandbox', 'enterprise', 'enterpriseAudit',
-        'enterpriseFrontend', 'ssrfProxy', 'unstructured', 'plugin_daemon',
-        'plugin_controller', 'plugin_connector', 'plugin_manager'
-    ]
-
-    # Ask user if they want to configure replica counts
-    configure_replicas = prompt_yes_no(_t('config_service_replicas'), default=False)
-
-    for service in services_with_replicas:
-        if service in generator.values:
-            # Skip replica configuration if service is disabled
-            service_enabled = generator.values[service].get('enabled', True)
-            if not service_enabled:
-                print_info(f"  {service}: {_t('service_disabled_skip_replica')}")
-                continue
-
-            # Get default replica count from template (default to 1 if not found)
-            default_replicas = generator.values[service].get('replicas', 1)
-
-            if configure_replicas:
-                # User wants to configure replica counts
-                replica_input = prompt(
-                    _t('replica_count_for').format(service=service),
-                    default=str(default_replicas),
-                    required=True
-                )
-                try:
-                    replica_count = int(replica_input)
-                    if replica_count < 1:
-                        print_warning(f"{_t('invalid_replica_count')}, {_t('using_default')}: {default_replicas}")
-                        replica_count = default_replicas
-                    generator.values[service]['replicas'] = replica_count
-                    print_success(f"  {service}: {replica_count} {_t('replica')}(s)")
-                except ValueError:
-                    print_warning(f"{_t('invalid_replica_count')}, {_t('using_default')}: {default_replicas}")
-                    generator.values[service]['replicas'] = default_replicas
-                    print_info(f"  {service}: {default_replicas} {_t('replica')}(s)")
-            else:
-                # Use default values
-                generator.values[service]['replicas'] = default_replicas
-                print_info(f"  {service}: {default_replicas} {_t('replica')}(s)")
+    # Ask user if they want to configure replica counts (only if any service is present)
+    present = [service for service in _SERVICES_WITH_REPLICAS if service in generator.values]
+    if not present:
+        print_info(_t('no_services_for_replicas'))
+    elif not prompt_yes_no(_t('config_service_replicas'), default=False):
+        # Keep template defaults; nothing to prompt or report per service
+        for service in present:
+            service_values = generator.values[service]
+            if service_values.get('enabled', True):
+                service_values.setdefault('replicas', 1)
+    else:
+        _prompt_service_replicas(generator, present)
 
     # Note: unstructured.enabled is automatically configured in global_config based on RAG etlType
     # No need to configure service enablement here
 
     # Apply version-specific features for services module
     # Features are automatically discovered based on chart_version
+    from modules.features import apply_features
     apply_features(generator, "services")
+
+
+def _prompt_service_replicas(generator, services):
+    """Interactively configure replica counts for enabled services"""
+    # Strings reused on every loop iteration
+    replica_count_for = _t('replica_count_for').format
+    replica_label = _t('replica')
+    disabled_skip_replica = _t('service_disabled_skip_replica')
+    invalid_replica_count = f"{_t('invalid_replica_count')}, {_t('using_default')}"
+
+    for service in services:
+        service_values = generator.values[service]
+
+        # Skip replica configuration if service is disabled
+        service_enabled = service_values.get('enabled', True)
+        if not service_enabled:
+            print_info(f"  {service}: {disabled_skip_replica}")
+            continue
+
+        # Get default replica count from template (default to 1 if not found)
+        default_replicas = service_values.get('replicas', 1)
+
+        replica_input = prompt(
+            replica_count_for(service=service),
+            default=str(default_replicas),
+            required=True
+        )
+        # Non-numeric input (including signs) falls back to the template default
+        if not replica_input.isdecimal():
+            print_warning(f"{invalid_replica_count}: {default_replicas}")
+            service_values['replicas'] = default_replicas
+            print_info(f"  {service}: {default_replicas} {replica_label}(s)")
+            continue
+
+        replica_count = int(replica_input)
+        if replica_count < 1:
+            print_warning(f"{invalid_replica_count}: {default_replicas}")
+            replica_count = default_replicas
+        service_values['replicas'] = replica_count
+        print_success(f"  {service}: {replica_count} {replica_label}(s)")
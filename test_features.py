@@ -12,7 +12,8 @@ import sys
 from pathlib import Path
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
 
 from modules.features.base import (
     parse_version,
@@ -21,6 +22,11 @@ from modules.features.base import (
     FeatureRegistry
 )
 
+# Source files inspected by the static checks below, read once
+GLOBAL_CONFIG_SRC = (PROJECT_ROOT / "modules" / "global_config.py").read_text()
+INFRASTRUCTURE_SRC = (PROJECT_ROOT / "modules" / "infrastructure.py").read_text()
+TRANSLATIONS_SRC = (PROJECT_ROOT / "i18n" / "translations.py").read_text()
+
 
 def test_version_parsing():
     """Test version parsing"""
@@ -107,9 +113,8 @@ def test_feature_order():
     """Test that triggerDomain is configured in domain section"""
     print("\n=== 检查 triggerDomain 配置位置 ===")
     
-    # Read global_config.py to check where triggerDomain is configured
-    global_config_path = Path(__file__).parent / "modules" / "global_config.py"
-    content = global_config_path.read_text()
+    # Check where triggerDomain is configured in global_config.py
+    content = GLOBAL_CONFIG_SRC
     
     # Check if triggerDomain is in domain config section
     domain_section_start = content.find("# Domain configuration")
@@ -134,9 +139,8 @@ def test_ssrf_proxy_sandbox_host():
     """Test that ssrfProxy.sandboxHost is configured as advanced option"""
     print("\n=== 检查 ssrfProxy.sandboxHost 配置 ===")
     
-    # Read infrastructure.py to check sandboxHost configuration
-    infra_config_path = Path(__file__).parent / "modules" / "infrastructure.py"
-    content = infra_config_path.read_text()
+    # Check sandboxHost configuration in infrastructure.py
+    content = INFRASTRUCTURE_SRC
     
     # Check if sandboxHost is in advanced config section
     if "sandboxHost" in content:
@@ -149,10 +153,7 @@ def test_ssrf_proxy_sandbox_host():
         print("  ✗ ssrfProxy.sandboxHost 未配置")
     
     # Check i18n translations
-    translations_path = Path(__file__).parent / "i18n" / "translations.py"
-    translations_content = translations_path.read_text()
-    
-    if "ssrf_proxy_sandbox_host" in translations_content:
+    if "ssrf_proxy_sandbox_host" in TRANSLATIONS_SRC:
         print("  ✓ i18n 翻译已添加")
     else:
         print("  ✗ i18n 翻译缺失")
@@ -162,7 +163,7 @@ def test_global_config_trigger_domain():
     """Test that triggerDomain is properly shown based on version"""
     print("\n=== 测试 triggerDomain 版本检测 ===")
     
-    from modules.features.base import version_satisfies
+    from modules.features.base import version_at_least
     
     test_cases = [
         ("3.6.0", False, "3.6.0 不应显示 triggerDomain"),
@@ -173,7 +174,7 @@ def test_global_config_trigger_domain():
     ]
     
     for version, expected, desc in test_cases:
-        result = version_satisfies(version, "3.7.0")
+        result = version_at_least(version, "3.7.0")
         status = "✓" if result == expected else "✗"
         print(f"  {status} {desc}: {result}")
 
@@ -183,7 +184,7 @@ def test_all_features_for_versions():
     print("\n=== 完整版本特性矩阵 ===")
     
     import modules.features
-    from modules.features.base import FeatureRegistry, version_satisfies
+    from modules.features.base import FeatureRegistry
     
     versions = ["3.5.6", "3.6.0", "3.6.5", "3.7.0", "3.7.2"]
     
@@ -198,10 +199,11 @@ def test_all_features_for_versions():
     print(header)
     print("  " + "-" * 70)
     
-    # Collect unique features across all versions
+    # Collect unique features across all versions, resolving each version once
+    per_version_features = {v: FeatureRegistry.get_all_features(v) for v in versions}
     all_feature_info = {}
-    for v in versions:
-        features_dict = FeatureRegistry.get_all_features(v)
+    support = {}
+    for v, features_dict in per_version_features.items():
         for module, feature_list in features_dict.items():
             for feature in feature_list:
                 key = feature.__class__.__name__
@@ -212,6 +214,7 @@ def test_all_features_for_versions():
                         'max_version': getattr(feature, 'max_version', None),
                         'module': module
                     }
+                support.setdefault(key, set()).add(v)
     
     # Display matrix
     for key, info in all_feature_info.items():
@@ -219,7 +222,7 @@ def test_all_features_for_versions():
         row = f"  {name}".ljust(35)
         
         for v in versions:
-            supported = version_satisfies(v, info['min_version'], info['max_version'])
+            supported = v in support[key]
             row += ("  ✓".center(8) if supported else "  -".center(8))
         print(row)
     
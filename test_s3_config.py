@@ -4,9 +4,11 @@
 """
 
 import sys
-import os
 import importlib.util
 
+# 复用缓存的模板解析结果（进程内 lru_cache + .cache/ 中的 JSON 副本）
+from generator import load_values
+
 # 加载 generate-values-prd.py 模块
 spec = importlib.util.spec_from_file_location("generate_values_prd", "generate-values-prd.py")
 generate_values_prd = importlib.util.module_from_spec(spec)
@@ -18,14 +20,16 @@ def test_s3_config():
     print("测试 AWS S3 存储配置")
     print("=" * 60)
     
-    # 检查 values.yaml 是否存在
-    if not os.path.exists('values.yaml'):
+    # 加载 values.yaml（文件不存在时直接失败）
+    try:
+        template_values = load_values('values.yaml')
+    except FileNotFoundError:
         print("✗ 错误: values.yaml 文件不存在")
         return False
     
     try:
         # 创建 ValuesGenerator 实例
-        generator = generate_values_prd.ValuesGenerator('values.yaml')
+        generator = generate_values_prd.ValuesGenerator('values.yaml', values=template_values)
         print("✓ ValuesGenerator 初始化成功")
         
         # 检查 persistence 配置结构
@@ -6,13 +6,118 @@
 
 import sys
 import os
+import copy
 import importlib.util
 
+# 复用缓存的模板解析结果（进程内 lru_cache + .cache/ 中的 JSON 副本）
+from generator import load_values
+
 # 加载 generate-values-prd.py 模块
 spec = importlib.util.spec_from_file_location("generate_values_prd", "generate-values-prd.py")
 generate_values_prd = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(generate_values_prd)
 
+def run_scenario(i, scenario, generator, template_values):
+    """运行单个场景，返回是否通过"""
+    print(f"\n{'='*60}")
+    print(f"{scenario['name']}")
+    print(f"{'='*60}")
+    
+    try:
+        # 重置为模板值
+        generator.values = copy.deepcopy(template_values)
+        
+        # 模拟配置
+        if scenario['s3_provider'] == "AWS S3":
+            generator.values['persistence']['s3']['useAwsS3'] = True
+            generator.values['persistence']['s3']['endpoint'] = scenario['endpoint']
+            generator.values['minio']['enabled'] = False
+            
+            if scenario['auth_method'] == "IRSA 模式（推荐）":
+                generator.values['persistence']['s3']['useAwsManagedIam'] = True
+                # 删除 accessKey 和 secretKey
+                if 'accessKey' in generator.values['persistence']['s3']:
+                    del generator.values['persistence']['s3']['accessKey']
+                if 'secretKey' in generator.values['persistence']['s3']:
+                    del generator.values['persistence']['s3']['secretKey']
+                
+                # 配置 ServiceAccount（如果有）
+                if scenario.get('api_sa'):
+                    generator.values['api']['serviceAccountName'] = scenario['api_sa']
+                if scenario.get('worker_sa'):
+                    generator.values['worker']['serviceAccountName'] = scenario['worker_sa']
+            else:  # Access Key 模式
+                generator.values['persistence']['s3']['useAwsManagedIam'] = False
+                generator.values['persistence']['s3']['accessKey'] = scenario['accessKey']
+                generator.values['persistence']['s3']['secretKey'] = scenario['secretKey']
+        else:  # MinIO 或其他
+            generator.values['persistence']['s3']['useAwsS3'] = False
+            generator.values['persistence']['s3']['useAwsManagedIam'] = False
+            generator.values['persistence']['s3']['endpoint'] = scenario['endpoint']
+            generator.values['persistence']['s3']['accessKey'] = scenario['accessKey']
+            generator.values['persistence']['s3']['secretKey'] = scenario['secretKey']
+            generator.values['minio']['enabled'] = True
+        
+        # 验证结果
+        expected = scenario['expected']
+        s3_config = generator.values['persistence']['s3']
+        
+        checks = []
+        
+        # 检查 useAwsS3
+        actual_useAwsS3 = s3_config.get('useAwsS3', False)
+        checks.append(("useAwsS3", actual_useAwsS3 == expected['useAwsS3'], actual_useAwsS3, expected['useAwsS3']))
+        
+        # 检查 useAwsManagedIam
+        actual_useAwsManagedIam = s3_config.get('useAwsManagedIam', False)
+        checks.append(("useAwsManagedIam", actual_useAwsManagedIam == expected['useAwsManagedIam'], actual_useAwsManagedIam, expected['useAwsManagedIam']))
+        
+        # 检查 accessKey
+        has_accessKey = 'accessKey' in s3_config
+        checks.append(("has_accessKey", has_accessKey == expected['has_accessKey'], has_accessKey, expected['has_accessKey']))
+        
+        # 检查 secretKey
+        has_secretKey = 'secretKey' in s3_config
+        checks.append(("has_secretKey", has_secretKey == expected['has_secretKey'], has_secretKey, expected['has_secretKey']))
+        
+        # 检查 ServiceAccount（如果场景中有）
+        if 'has_api_sa' in expected:
+            api_sa_value = generator.values['api'].get('serviceAccountName', '')
+            has_api_sa = bool(api_sa_value)
+            checks.append(("has_api_sa", has_api_sa == expected['has_api_sa'], f"'{api_sa_value}'", expected['has_api_sa']))
+        
+        if 'has_worker_sa' in expected:
+            worker_sa_value = generator.values['worker'].get('serviceAccountName', '')
+            has_worker_sa = bool(worker_sa_value)
+            checks.append(("has_worker_sa", has_worker_sa == expected['has_worker_sa'], f"'{worker_sa_value}'", expected['has_worker_sa']))
+        
+        # 检查 MinIO（如果场景中有）
+        if 'minio_enabled' in expected:
+            actual_minio_enabled = generator.values['minio'].get('enabled', False)
+            checks.append(("minio_enabled", actual_minio_enabled == expected['minio_enabled'], actual_minio_enabled, expected['minio_enabled']))
+        
+        # 打印检查结果
+        scenario_passed = True
+        for check_name, passed, actual, expected_val in checks:
+            status = "✓" if passed else "✗"
+            print(f"  {status} {check_name}: {actual} (期望: {expected_val})")
+            if not passed:
+                scenario_passed = False
+        
+        if scenario_passed:
+            print(f"  ✓ 场景 {i} 通过")
+        else:
+            print(f"  ✗ 场景 {i} 失败")
+            
+    except Exception as e:
+        print(f"  ✗ 场景 {i} 出错: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    
+    return scenario_passed
+
+
 def test_all_scenarios():
     """测试所有配置场景"""
     print("=" * 60)
@@ -84,102 +189,16 @@ def test_all_scenarios():
     
     all_passed = True
     
+    # 模板只解析一次，每个场景使用其副本
+    try:
+        generator = generate_values_prd.ValuesGenerator('values.yaml', values=load_values('values.yaml'))
+    except FileNotFoundError:
+        print("✗ 错误: values.yaml 文件不存在")
+        return False
+    template_values = copy.deepcopy(generator.values)
+    
     for i, scenario in enumerate(scenarios, 1):
-        print(f"\n{'='*60}")
-        print(f"{scenario['name']}")
-        print(f"{'='*60}")
-        
-        try:
-            # 重新加载模板
-            generator = generate_values_prd.ValuesGenerator('values.yaml')
-            
-            # 模拟配置
-            if scenario['s3_provider'] == "AWS S3":
-                generator.values['persistence']['s3']['useAwsS3'] = True
-                generator.values['persistence']['s3']['endpoint'] = scenario['endpoint']
-                generator.values['minio']['enabled'] = False
-                
-                if scenario['auth_method'] == "IRSA 模式（推荐）":
-                    generator.values['persistence']['s3']['useAwsManagedIam'] = True
-                    # 删除 accessKey 和 secretKey
-                    if 'accessKey' in generator.values['persistence']['s3']:
-                        del generator.values['persistence']['s3']['accessKey']
-                    if 'secretKey' in generator.values['persistence']['s3']:
-                        del generator.values['persistence']['s3']['secretKey']
-                    
-                    # 配置 ServiceAccount（如果有）
-                    if scenario.get('api_sa'):
-                        generator.values['api']['serviceAccountName'] = scenario['api_sa']
-                    if scenario.get('worker_sa'):
-                        generator.values['worker']['serviceAccountName'] = scenario['worker_sa']
-                else:  # Access Key 模式
-                    generator.values['persistence']['s3']['useAwsManagedIam'] = False
-                    generator.values['persistence']['s3']['accessKey'] = scenario['accessKey']
-                    generator.values['persistence']['s3']['secretKey'] = scenario['secretKey']
-            else:  # MinIO 或其他
-                generator.values['persistence']['s3']['useAwsS3'] = False
-                generator.values['persistence']['s3']['useAwsManagedIam'] = False
-                generator.values['persistence']['s3']['endpoint'] = scenario['endpoint']
-                generator.values['persistence']['s3']['accessKey'] = scenario['accessKey']
-                generator.values['persistence']['s3']['secretKey'] = scenario['secretKey']
-                generator.values['minio']['enabled'] = True
-            
-            # 验证结果
-            expected = scenario['expected']
-            s3_config = generator.values['persistence']['s3']
-            
-            checks = []
-            
-            # 检查 useAwsS3
-            actual_useAwsS3 = s3_config.get('useAwsS3', False)
-            checks.append(("useAwsS3", actual_useAwsS3 == expected['useAwsS3'], actual_useAwsS3, expected['useAwsS3']))
-            
-            # 检查 useAwsManagedIam
-            actual_useAwsManagedIam = s3_config.get('useAwsManagedIam', False)
-            checks.append(("useAwsManagedIam", actual_useAwsManagedIam == expected['useAwsManagedIam'], actual_useAwsManagedIam, expected['useAwsManagedIam']))
-            
-            # 检查 accessKey
-            has_accessKey = 'accessKey' in s3_config
-            checks.append(("has_accessKey", has_accessKey == expected['has_accessKey'], has_accessKey, expected['has_accessKey']))
-            
-            # 检查 secretKey
-            has_secretKey = 'secretKey' in s3_config
-            checks.append(("has_secretKey", has_secretKey == expected['has_secretKey'], has_secretKey, expected['has_secretKey']))
-            
-            # 检查 ServiceAccount（如果场景中有）
-            if 'has_api_sa' in expected:
-                api_sa_value = generator.values['api'].get('serviceAccountName', '')
-                has_api_sa = bool(api_sa_value)
-                checks.append(("has_api_sa", has_api_sa == expected['has_api_sa'], f"'{api_sa_value}'", expected['has_api_sa']))
-            
-            if 'has_worker_sa' in expected:
-                worker_sa_value = generator.values['worker'].get('serviceAccountName', '')
-                has_worker_sa = bool(worker_sa_value)
-                checks.append(("has_worker_sa", has_worker_sa == expected['has_worker_sa'], f"'{worker_sa_value}'", expected['has_worker_sa']))
-            
-            # 检查 MinIO（如果场景中有）
-            if 'minio_enabled' in expected:
-                actual_minio_enabled = generator.values['minio'].get('enabled', False)
-                checks.append(("minio_enabled", actual_minio_enabled == expected['minio_enabled'], actual_minio_enabled, expected['minio_enabled']))
-            
-            # 打印检查结果
-            scenario_passed = True
-            for check_name, passed, actual, expected_val in checks:
-                status = "✓" if passed else "✗"
-                print(f"  {status} {check_name}: {actual} (期望: {expected_val})")
-                if not passed:
-                    scenario_passed = False
-                    all_passed = False
-            
-            if scenario_passed:
-                print(f"  ✓ 场景 {i} 通过")
-            else:
-                print(f"  ✗ 场景 {i} 失败")
-                
-        except Exception as e:
-            print(f"  ✗ 场景 {i} 出错: {e}")
-            import traceback
-            traceback.print_exc()
+        if not run_scenario(i, scenario, generator, template_values):
             all_passed = False
     
     print(f"\n{'='*60}")
@@ -4,15 +4,55 @@ Test Module 6: Service Configuration
 单独测试服务配置模块
 """
 
-import os
 import sys
-from i18n import set_language, get_translator
-from i18n.language import prompt_language_selection
-from generator import ValuesGenerator
-from modules.services import configure_services
+import traceback
+
+# Services whose enablement status is reported before and after configuration
+SERVICES = ('api', 'worker', 'workerBeat', 'web', 'sandbox',
+            'enterprise', 'enterpriseAudit', 'enterpriseFrontend',
+            'ssrfProxy', 'unstructured', 'plugin_daemon', 'plugin_manager')
+
+# Auto-generated enterprise secrets reported by the test
+SECRET_KEYS = ('appSecretKey', 'adminAPIsSecretKeySalt', 'passwordEncryptionKey')
+
+# Expected types of enterprise fields in the template (checked only when present)
+ENTERPRISE_FIELD_TYPES = {
+    'enabled': bool,
+    'licenseMode': str,
+    'licenseServer': str,
+    **{key: str for key in SECRET_KEYS},
+}
+
+
+def enterprise_type_errors(enterprise_config):
+    """Return fields whose template value has an unexpected type (null is allowed)"""
+    return [
+        f"{key}: expected {expected.__name__}, got {type(enterprise_config[key]).__name__}"
+        for key, expected in ENTERPRISE_FIELD_TYPES.items()
+        if enterprise_config.get(key) is not None and not isinstance(enterprise_config[key], expected)
+    ]
+
+
+def mask_secret(value):
+    """Show only the first 20 characters of a secret, or 'Not set' when empty"""
+    return f"{str(value)[:20]}..." if value else "Not set"
+
+
+def service_status_block(generator, services):
+    """Format the enablement status of the given services as one block"""
+    return "\n".join(f"  - {service}: {generator.values[service].get('enabled', True)}" for service in services)
+
 
 def test_services_module():
     """Test services configuration module"""
+    # Heavy imports are deferred until the test actually runs
+    import yaml
+    from i18n import get_translator
+    from i18n.language import prompt_language_selection
+    from generator import ValuesGenerator, load_values_subset
+    from modules.services import configure_services, _SERVICES_WITH_REPLICAS
+    from utils import print_info, print_error, print_success, print_warning
+
     print("=" * 60)
     print("Test Module 6: Service Configuration")
     print("=" * 60)
@@ -21,9 +61,14 @@ def test_services_module():
     prompt_language_selection()
     _t = get_translator()
     
-    # Check if values.yaml exists
+    # Load values.yaml (a missing file is detected by the load itself, no separate stat)
     source_file = "values.yaml"
-    if not os.path.exists(source_file):
+    try:
+        # Only the subtrees the services module and this report touch
+        template_values = load_values_subset(
+            source_file, ('enterprise',) + SERVICES + _SERVICES_WITH_REPLICAS
+        )
+    except FileNotFoundError:
         print_error(f"{_t('file_not_found')}: {source_file}")
         print_info("Please download values.yaml first or use --local with --chart-version")
         return False
@@ -34,9 +79,11 @@ def test_services_module():
         generator = ValuesGenerator(
             source_file=source_file,
             version="3.x",  # Use 3.x for testing
-            chart_version="3.5.6"  # Use a test version
+            chart_version="3.5.6",  # Use a test version
+            values=template_values  # Reuse the cached parse of the template
         )
         print_success("ValuesGenerator initialized successfully")
+        print_info(f"PyYAML libyaml support: {yaml.__with_libyaml__}")
         
         # Check enterprise configuration structure
         if 'enterprise' not in generator.values:
@@ -45,22 +92,21 @@ def test_services_module():
         
         print_info("\nInitial enterprise configuration:")
         enterprise_config = generator.values.get('enterprise', {})
-        print(f"  - enabled: {enterprise_config.get('enabled', 'Not set')}")
-        print(f"  - licenseMode: {enterprise_config.get('licenseMode', 'Not set')}")
-        print(f"  - licenseServer: {enterprise_config.get('licenseServer', 'Not set')}")
-        print(f"  - appSecretKey: {'Set' if 'appSecretKey' in enterprise_config else 'Not set'}")
-        print(f"  - adminAPIsSecretKeySalt: {'Set' if 'adminAPIsSecretKeySalt' in enterprise_config else 'Not set'}")
-        print(f"  - passwordEncryptionKey: {'Set' if 'passwordEncryptionKey' in enterprise_config else 'Not set'}")
+        for error in enterprise_type_errors(enterprise_config):
+            print_warning(f"Unexpected template value type - {error}")
+        lines = [
+            f"  - enabled: {enterprise_config.get('enabled', 'Not set')}",
+            f"  - licenseMode: {enterprise_config.get('licenseMode', 'Not set')}",
+            f"  - licenseServer: {enterprise_config.get('licenseServer', 'Not set')}",
+        ]
+        lines += [f"  - {key}: {'Set' if key in enterprise_config else 'Not set'}" for key in SECRET_KEYS]
+        print("\n".join(lines))
         
         # Check service enablement status
         print_info("\nInitial service enablement status:")
-        services = ['api', 'worker', 'workerBeat', 'web', 'sandbox',
-                   'enterprise', 'enterpriseAudit', 'enterpriseFrontend',
-                   'ssrfProxy', 'unstructured', 'plugin_daemon', 'plugin_manager']
-        for service in services:
-            if service in generator.values:
-                enabled = generator.values[service].get('enabled', True)
-                print(f"  - {service}: {enabled}")
+        present_services = [service for service in SERVICES if service in generator.values]
+        if present_services:
+            print(service_status_block(generator, present_services))
         
         # Run the services configuration module
         print("\n" + "=" * 60)
@@ -76,31 +122,28 @@ def test_services_module():
         
         enterprise_config = generator.values.get('enterprise', {})
         print("\nEnterprise Configuration:")
-        print(f"  - enabled: {enterprise_config.get('enabled', 'Not set')}")
-        print(f"  - licenseMode: {enterprise_config.get('licenseMode', 'Not set')}")
-        if 'licenseMode' in enterprise_config and enterprise_config['licenseMode'] == 'online':
-            print(f"  - licenseServer: {enterprise_config.get('licenseServer', 'Not set (needs manual configuration)')}")
-        print(f"  - appSecretKey: {enterprise_config.get('appSecretKey', 'Not set')[:20]}..." if 'appSecretKey' in enterprise_config else "  - appSecretKey: Not set")
-        print(f"  - adminAPIsSecretKeySalt: {enterprise_config.get('adminAPIsSecretKeySalt', 'Not set')[:20]}..." if 'adminAPIsSecretKeySalt' in enterprise_config else "  - adminAPIsSecretKeySalt: Not set")
-        print(f"  - passwordEncryptionKey: {enterprise_config.get('passwordEncryptionKey', 'Not set')[:20]}..." if 'passwordEncryptionKey' in enterprise_config else "  - passwordEncryptionKey: Not set")
+        lines = [
+            f"  - enabled: {enterprise_config.get('enabled', 'Not set')}",
+            f"  - licenseMode: {enterprise_config.get('licenseMode', 'Not set')}",
+        ]
+        if enterprise_config.get('licenseMode') == 'online':
+            lines.append(f"  - licenseServer: {enterprise_config.get('licenseServer', 'Not set (needs manual configuration)')}")
+        lines += [f"  - {key}: {mask_secret(enterprise_config.get(key))}" for key in SECRET_KEYS]
+        print("\n".join(lines))
         
         print("\nService Enablement Status:")
-        for service in services:
-            if service in generator.values:
-                enabled = generator.values[service].get('enabled', True)
-                print(f"  - {service}: {enabled}")
+        if present_services:
+            print(service_status_block(generator, present_services))
         
         print_success("\n✓ Service configuration module test completed successfully!")
         return True
         
     except Exception as e:
         print_error(f"Error during test: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 if __name__ == "__main__":
-    from utils import print_info, print_error, print_success, print_warning
     success = test_services_module()
     sys.exit(0 if success else 1)
 
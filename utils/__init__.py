@@ -1,19 +1,27 @@
 """Utility modules for Dify EE (Enterprise Edition) Helm Chart Values Generator"""
 
-from .colors import Colors, print_header, print_section, print_info, print_success, print_warning, print_error
-from .prompts import prompt, prompt_yes_no, prompt_choice
+from .colors import (
+    Colors, SEPARATOR, print_header, print_section, print_info, print_block, print_success, print_warning,
+    print_error
+)
+from .prompts import prompt, prompt_or_default, prompt_int, prompt_float, prompt_yes_no, prompt_choice
 from .secrets import generate_secret
 from .downloader import get_or_download_values
 
 __all__ = [
     'Colors',
+    'SEPARATOR',
     'print_header',
     'print_section',
     'print_info',
+    'print_block',
     'print_success',
     'print_warning',
     'print_error',
     'prompt',
+    'prompt_or_default',
+    'prompt_int',
+    'prompt_float',
     'prompt_yes_no',
     'prompt_choice',
     'generate_secret',
@@ -1,47 +1,88 @@
 """Terminal colors and print utilities"""
 
+import os
+import sys
+
+# Horizontal rule used by headers and banner blocks
+SEPARATOR = '=' * 60
+
+
+# Skip ANSI escapes when output is redirected or NO_COLOR is set (https://no-color.org)
+_USE_COLOR = bool(getattr(sys.stdout, 'isatty', lambda: False)()) and "NO_COLOR" not in os.environ
+
+
+def _ansi(code: str) -> str:
+    """Return the escape sequence, or '' when colors are disabled"""
+    return code if _USE_COLOR else ''
+
+
+HEADER = _ansi('\033[95m')
+OKBLUE = _ansi('\033[94m')
+OKCYAN = _ansi('\033[96m')
+OKGREEN = _ansi('\033[92m')
+WARNING = _ansi('\033[93m')
+FAIL = _ansi('\033[91m')
+ENDC = _ansi('\033[0m')
+BOLD = _ansi('\033[1m')
+UNDERLINE = _ansi('\033[4m')
+
 
 class Colors:
-    """Terminal colors"""
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+    """Terminal colors (namespace kept for existing callers)"""
+    HEADER = HEADER
+    OKBLUE = OKBLUE
+    OKCYAN = OKCYAN
+    OKGREEN = OKGREEN
+    WARNING = WARNING
+    FAIL = FAIL
+    ENDC = ENDC
+    BOLD = BOLD
+    UNDERLINE = UNDERLINE
+
+
+# Precomputed color prefixes so each print call only formats the message;
+# empty messages print a bare blank line instead of a lone marker
+_END = ENDC
+_HDR = HEADER + BOLD
+_BAR = _HDR + SEPARATOR + _END
+_SEC = OKCYAN + BOLD + ">>> "
+_INFO = OKBLUE + "ℹ "
+_OK = OKGREEN + "✓ "
+_WARN = WARNING + "⚠ "
+_ERR = FAIL + "✗ "
+_HEADER_TMPL = f"\n{_BAR}\n{_HDR}{{:^60}}{_END}\n{_BAR}\n\n"
 
 
 def print_header(text: str):
     """Print header"""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{text:^60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}\n")
+    sys.stdout.write(_HEADER_TMPL.format(text))
 
 
 def print_section(text: str):
     """Print section"""
-    print(f"\n{Colors.OKCYAN}{Colors.BOLD}>>> {text}{Colors.ENDC}")
+    print(f"\n{_SEC}{text}{_END}")
 
 
 def print_info(text: str):
     """Print info"""
-    print(f"{Colors.OKBLUE}ℹ {text}{Colors.ENDC}")
+    print(f"{_INFO}{text}{_END}" if text else "")
+
+
+def print_block(*lines: str):
+    """Print several info lines with a single write (empty lines stay blank)"""
+    print("\n".join(f"{_INFO}{line}{_END}" if line else "" for line in lines))
 
 
 def print_success(text: str):
     """Print success message"""
-    print(f"{Colors.OKGREEN}✓ {text}{Colors.ENDC}")
+    print(f"{_OK}{text}{_END}" if text else "")
 
 
 def print_warning(text: str):
     """Print warning"""
-    print(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}")
+    print(f"{_WARN}{text}{_END}" if text else "")
 
 
 def print_error(text: str):
     """Print error"""
-    print(f"{Colors.FAIL}✗ {text}{Colors.ENDC}")
-
+    print(f"{_ERR}{text}{_END}" if text else "")
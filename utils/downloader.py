@@ -5,19 +5,387 @@ import subprocess
 import sys
 import shutil
 import json
-import urllib.request
+import io
+import re
+import time
 import yaml
-import tarfile
-from typing import Optional, List
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO, Dict, Optional, List
 from pathlib import Path
 
-from .colors import print_info, print_success, print_warning, print_error
+from .colors import print_info, print_block, print_success, print_warning, print_error
 from .prompts import prompt_choice
 from i18n import get_translator
 import config
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml-backed, much faster on large index files
+except ImportError:
+    from yaml import SafeLoader
+
 _t = get_translator()
 
+# Repositories already added/updated in this process: repo name -> time.monotonic() of the update
+_REPO_READY: Dict[str, float] = {}
+REPO_UPDATE_TTL = 600
+
+# Repositories whose Helm cache index was written from our own index.yaml download
+_INDEX_SEEDED: Dict[str, float] = {}
+
+# Cached values files are named values-<version>.yaml; the last downloaded version is kept alongside
+_CACHED_VERSION_RE = re.compile(r'values-([\d.]+(?:-[a-zA-Z0-9.]+)?)\.yaml')
+LAST_VERSION_FILE = ".last-version"
+
+# How long cached index.yaml entries may stand in when the repository is unreachable
+INDEX_CACHE_TTL = 300
+
+# Background network work started while the user is answering the version prompt
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="helm-prefetch")
+_PREFETCH: Dict[tuple, Future] = {}
+
+
+def _helm(*args: str, capture: bool = False) -> str:
+    """
+    Run a helm command and return its stdout as text ("" unless capture is set)
+
+    Raises:
+        subprocess.CalledProcessError: If helm exits non-zero (stderr is kept on the exception)
+    """
+    result = subprocess.run(
+        ["helm", *args],
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True
+    )
+    return result.stdout or ""
+
+
+def _take_prefetch(key: tuple) -> Optional[Future]:
+    """Remove and return a pending prefetch future, if one was started"""
+    return _PREFETCH.pop(key, None)
+
+
+@lru_cache(maxsize=1)
+def _helm_repository_cache() -> Optional[Path]:
+    """Helm's repository cache directory (where `<repo>-index.yaml` files live)"""
+    try:
+        cache_dir = _helm("env", "HELM_REPOSITORY_CACHE", capture=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return Path(cache_dir) if cache_dir else None
+
+
+def _helm_repo_points_at(repo_name: str, repo_url: str) -> bool:
+    """Whether Helm has repo_name registered with repo_url (so its cached index is that repository's)"""
+    try:
+        repo_list = json.loads(_helm("repo", "list", "-o", "json", capture=True))
+    except (OSError, subprocess.CalledProcessError, json.JSONDecodeError):
+        return False
+    return any(
+        r.get("name") == repo_name and (r.get("url") or "").rstrip('/') == repo_url.rstrip('/')
+        for r in repo_list
+    )
+
+
+def _seed_helm_index(repo_name: str, repo_url: str, body: str) -> None:
+    """
+    Write a freshly downloaded index.yaml into Helm's cache, standing in for `helm repo update`
+
+    Only done when Helm's repo_name is registered with repo_url; another repository's
+    cache (e.g. a mirror passed with --repo-url under the default name) is left alone.
+    """
+    if not shutil.which("helm") or not _helm_repo_points_at(repo_name, repo_url):
+        return
+    cache_dir = _helm_repository_cache()
+    if cache_dir is None:
+        return
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / f"{repo_name}-index.yaml").write_text(body, encoding='utf-8')
+    except OSError:
+        return
+    _INDEX_SEEDED[repo_name] = time.monotonic()
+
+
+def _read_helm_index(repo_name: str, repo_url: str) -> Optional[str]:
+    """Helm's own cached index.yaml for a repository, if it has one registered with repo_url"""
+    if not shutil.which("helm") or not _helm_repo_points_at(repo_name, repo_url):
+        return None
+    cache_dir = _helm_repository_cache()
+    if cache_dir is None:
+        return None
+    try:
+        return (cache_dir / f"{repo_name}-index.yaml").read_text(encoding='utf-8')
+    except OSError:
+        return None
+
+
+def _add_and_update_repo(repo_name: str, repo_url: str) -> None:
+    """
+    Add the Helm repository if missing, otherwise update its index
+
+    `helm repo add` downloads the index itself, and an index seeded from our own
+    download within REPO_UPDATE_TTL is as fresh as `helm repo update` would make it.
+    """
+    try:
+        repo_list = json.loads(_helm("repo", "list", "-o", "json", capture=True))
+        repo_exists = repo_name in [r.get("name", "") for r in repo_list]
+        if not repo_exists:
+            print_info(f"{_t('adding_repo')}: {repo_name}")
+            _helm("repo", "add", repo_name, repo_url)
+    except (subprocess.CalledProcessError, json.JSONDecodeError):
+        # `helm repo list` fails when no repositories are configured yet
+        repo_exists = False
+        _helm("repo", "add", repo_name, repo_url)
+
+    seeded_at = _INDEX_SEEDED.get(repo_name)
+    if repo_exists and (seeded_at is None or time.monotonic() - seeded_at >= REPO_UPDATE_TTL):
+        _helm("repo", "update", repo_name)
+    _REPO_READY[repo_name] = time.monotonic()
+
+
+def _ensure_repo(repo_name: str, repo_url: str, ttl: float = REPO_UPDATE_TTL) -> None:
+    """
+    Make sure the Helm repository is added and its index is fresh
+
+    Runs `helm repo list/add/update` at most once per repository within `ttl` seconds.
+
+    Raises:
+        subprocess.CalledProcessError: If the repository cannot be added or updated
+    """
+    ready_at = _REPO_READY.get(repo_name)
+    if ready_at is not None and time.monotonic() - ready_at < ttl:
+        return
+
+    _add_and_update_repo(repo_name, repo_url)
+
+
+def _start_prefetch(chart_name: str, repo_url: str, repo_name: str) -> None:
+    """Start fetching index.yaml in the background (Helm repos are only touched when helm is used)"""
+    index_key = ("index", repo_url, chart_name)
+    if index_key not in _PREFETCH:
+        _PREFETCH[index_key] = _PREFETCH_POOL.submit(_fetch_chart_entries, chart_name, repo_url, repo_name)
+
+
+def _version_key(version: str) -> tuple:
+    """
+    Sort key for chart versions following SemVer precedence
+
+    Pre-releases sort before their release (3.6.0-beta.1 < 3.6.0-rc.1 < 3.6.0);
+    unparsable versions sort below all valid ones.
+    """
+    main, _, pre_release = version.partition('+')[0].partition('-')
+    try:
+        release = tuple(int(part) for part in main.split('.'))
+    except ValueError:
+        return (0,)
+    # Numeric identifiers rank below alphanumeric ones, as SemVer specifies
+    pre_parts = tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in pre_release.split('.')
+    ) if pre_release else ()
+    return (1, release, not pre_release, pre_parts)
+
+
+def _latest_stable(versions: List[str]) -> Optional[str]:
+    """Newest non-pre-release version, the one `helm search repo` reports by default"""
+    stable = [v for v in versions if '-' not in v]
+    return max(stable, key=_version_key) if stable else None
+
+
+def _index_cache_path() -> Path:
+    """JSON cache of chart entries from repository index files"""
+    return Path(config.CACHE_DIR) / "index-cache.json"
+
+
+def _load_index_cache() -> dict:
+    try:
+        return json.loads(_index_cache_path().read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index_cache(cache: dict) -> None:
+    """Write the cache atomically; a prefetch thread and the main thread may both save it"""
+    try:
+        cache_file = _index_cache_path()
+        cache_file.parent.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, prefix=cache_file.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+# Top-level keys (`entries:`, `generated:`) and chart keys under `entries:` in index.yaml
+_INDEX_TOP_KEY = re.compile(r'^[^\s#-]', re.MULTILINE)
+_INDEX_CHART_KEY = re.compile(r'^  [^\s#-]', re.MULTILINE)
+
+
+def _parse_chart_entries(body: str, chart_name: str) -> List[dict]:
+    """
+    Parse the entries of one chart from index.yaml text
+
+    Only the `entries.<chart_name>` block is handed to the YAML parser, which skips
+    every other chart in multi-chart repositories. Falls back to a full parse when
+    the file is not laid out the way `helm repo index` writes it.
+    """
+    entries_at = re.search(r'^entries:\n', body, re.MULTILINE)
+    if entries_at:
+        next_top = _INDEX_TOP_KEY.search(body, entries_at.end())
+        entries_end = next_top.start() if next_top else len(body)
+        chart_at = re.compile(rf'^  {re.escape(chart_name)}:\n', re.MULTILINE).search(
+            body, entries_at.end(), entries_end
+        )
+        if chart_at:
+            next_chart = _INDEX_CHART_KEY.search(body, chart_at.end(), entries_end)
+            block = body[chart_at.start():next_chart.start() if next_chart else entries_end]
+            try:
+                chart_data = yaml.load(block, Loader=SafeLoader)
+            except yaml.YAMLError:
+                chart_data = None
+            if isinstance(chart_data, dict) and isinstance(chart_data.get(chart_name), list):
+                return chart_data[chart_name]
+
+    index_data = yaml.load(body, Loader=SafeLoader)
+    if not index_data or 'entries' not in index_data:
+        return []
+    return index_data['entries'].get(chart_name) or []
+
+
+def _version_entries(chart_entries: List[dict]) -> List[dict]:
+    """Keep only the fields we use (version and urls) from index.yaml chart entries"""
+    return [
+        {'version': entry['version'], 'urls': entry.get('urls') or []}
+        for entry in chart_entries if entry.get('version')
+    ]
+
+
+def _fetch_chart_entries(chart_name: str, repo_url: str, repo_name: Optional[str] = None) -> List[dict]:
+    """
+    Return the index.yaml entries (version and urls) for one chart
+
+    Entries are cached on disk with the response's ETag/Last-Modified, so an
+    unchanged index is answered with 304 and neither downloaded nor parsed again.
+    If the repository cannot be reached or answers with an HTTP error, entries fetched
+    within INDEX_CACHE_TTL are used, then Helm's own cached index for repo_name. With repo_name, a downloaded index is
+    also written to Helm's cache for that repository when Helm has it registered with repo_url.
+    """
+    # Imported here: urllib.request alone is ~20ms, and runs using a local values.yaml never go online
+    import urllib.error
+    import urllib.request
+
+    index_url = f"{repo_url.rstrip('/')}/index.yaml"
+    cache = _load_index_cache()
+    cached = cache.get(index_url, {}).get(chart_name)
+
+    request = urllib.request.Request(index_url)
+    if cached:
+        if cached.get('etag'):
+            request.add_header('If-None-Match', cached['etag'])
+        if cached.get('last_modified'):
+            request.add_header('If-Modified-Since', cached['last_modified'])
+
+    try:
+        with urllib.request.urlopen(request, timeout=config.DOWNLOAD_TIMEOUT) as response:
+            body = response.read().decode('utf-8')
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+    except OSError as e:
+        # 304 Not Modified: the cached entries are current
+        if isinstance(e, urllib.error.HTTPError) and e.code == 304 and cached:
+            cached['fetched_at'] = time.time()
+            _save_index_cache(cache)
+            return cached['entries']
+        # Unreachable or an HTTP error (403, 5xx): recent cached entries, then Helm's cached index
+        if cached and time.time() - cached.get('fetched_at', 0) < INDEX_CACHE_TTL:
+            return cached['entries']
+        helm_index = _read_helm_index(repo_name, repo_url) if repo_name else None
+        if helm_index is None:
+            raise
+        return _version_entries(_parse_chart_entries(helm_index, chart_name))
+
+    if repo_name:
+        _seed_helm_index(repo_name, repo_url, body)
+
+    entries = _version_entries(_parse_chart_entries(body, chart_name))
+
+    cache.setdefault(index_url, {})[chart_name] = {
+        'etag': etag,
+        'last_modified': last_modified,
+        'fetched_at': time.time(),
+        'entries': entries,
+    }
+    _save_index_cache(cache)
+    return entries
+
+
+def _download_chart_archive(
+    chart_name: str,
+    repo_url: str,
+    version: Optional[str] = None
+) -> Optional[tuple[bytes, str]]:
+    """
+    Download a chart .tgz straight from the URL listed in index.yaml
+
+    Without a version, the newest stable entry is used, matching Helm's default.
+
+    Returns:
+        Tuple of (archive bytes, chart version), or None if the download failed
+    """
+    import urllib.parse
+    import urllib.request
+
+    try:
+        entries = _fetch_chart_entries(chart_name, repo_url)
+        target = version or _latest_stable([e['version'] for e in entries])
+        entry = next((e for e in entries if e['version'] == target), None)
+        if not entry or not entry.get('urls'):
+            return None
+
+        chart_url = urllib.parse.urljoin(f"{repo_url.rstrip('/')}/", entry['urls'][0])
+        with urllib.request.urlopen(chart_url, timeout=config.DOWNLOAD_TIMEOUT) as response:
+            return response.read(), entry['version']
+    except Exception:
+        return None
+
+
+def _fetch_values_direct(
+    chart_name: str,
+    repo_url: str,
+    version: Optional[str] = None
+) -> Optional[tuple[str, str]]:
+    """
+    Fetch values.yaml straight from the chart tarball listed in index.yaml
+
+    Avoids spawning `helm show values` (and the repo add/update it needs).
+
+    Returns:
+        Tuple of (values.yaml content, chart version), or None if the direct fetch failed
+    """
+    import tarfile
+
+    downloaded = _download_chart_archive(chart_name, repo_url, version)
+    if downloaded is None:
+        return None
+    archive, chart_version = downloaded
+    try:
+        with tarfile.open(fileobj=io.BytesIO(archive), mode='r:gz') as tar:
+            member = tar.extractfile(f"{chart_name}/values.yaml")
+            if member is None:
+                return None
+            return member.read().decode('utf-8'), chart_version
+    except (tarfile.TarError, KeyError, UnicodeDecodeError):
+        return None
+
 
 def get_helm_chart_versions(
     chart_name: Optional[str] = None,
@@ -33,7 +401,7 @@ def get_helm_chart_versions(
     Args:
         chart_name: Chart name, defaults to config.HELM_CHART_NAME
         repo_url: Helm Chart repository URL, defaults to config.HELM_REPO_URL
-        repo_name: Repository name, defaults to config.HELM_REPO_NAME (not used, kept for compatibility)
+        repo_name: Repository name, defaults to config.HELM_REPO_NAME (its Helm cache index is refreshed too)
 
     Returns:
         List of available versions (sorted, latest first)
@@ -41,30 +409,24 @@ def get_helm_chart_versions(
     # Use global config defaults if not provided
     chart_name = chart_name or config.HELM_CHART_NAME
     repo_url = repo_url or config.HELM_REPO_URL
+    repo_name = repo_name or config.HELM_REPO_NAME
 
     versions = []
 
     # Directly download index.yaml to get all versions
     try:
-        index_url = f"{repo_url.rstrip('/')}/index.yaml"
         print_info(_t('fetching_versions_from_index'))
-        with urllib.request.urlopen(index_url, timeout=config.DOWNLOAD_TIMEOUT) as response:
-            index_data = yaml.safe_load(response.read())
-            if index_data and 'entries' in index_data:
-                chart_entries = index_data['entries'].get(chart_name, [])
-                versions = [entry.get('version', '') for entry in chart_entries if entry.get('version')]
+        pending = _take_prefetch(("index", repo_url, chart_name))
+        if pending is not None:
+            chart_entries = pending.result(timeout=config.DOWNLOAD_TIMEOUT)
+        else:
+            chart_entries = _fetch_chart_entries(chart_name, repo_url, repo_name)
+        versions = [entry.get('version', '') for entry in chart_entries if entry.get('version')]
     except Exception as e:
         print_warning(f"{_t('failed_to_fetch_versions')}: {e}")
 
     # Sort versions (semantic versioning, latest first)
-    def version_key(v):
-        try:
-            parts = v.split('.')
-            return tuple(int(p) if p.isdigit() else 0 for p in parts)
-        except:
-            return (0, 0, 0)
-
-    versions = sorted(set(versions), key=version_key, reverse=True)
+    versions = sorted(set(versions), key=_version_key, reverse=True)
     return versions
 
 
@@ -72,19 +434,21 @@ def get_published_version(
     chart_name: Optional[str] = None,
     repo_url: Optional[str] = None,
     repo_name: Optional[str] = None,
-    version: Optional[str] = None
+    version: Optional[str] = None,
+    strict: bool = False
 ) -> Optional[str]:
     """
-    Get published version using Helm command
+    Get published version from the repository index
 
     This function is used when downloading values.yaml for a specific version.
-    It uses Helm command to ensure the version is actually published and available.
+    It looks the version up in the (cached) index.yaml, so no subprocess is needed.
 
     Args:
         chart_name: Chart name, defaults to config.HELM_CHART_NAME
         repo_url: Helm Chart repository URL, defaults to config.HELM_REPO_URL
         repo_name: Repository name, defaults to config.HELM_REPO_NAME
         version: Specific version to check, if None returns latest published version
+        strict: Verify against Helm's own repository cache via `helm search repo` instead
 
     Returns:
         Version string if found, None otherwise
@@ -94,42 +458,27 @@ def get_published_version(
     repo_url = repo_url or config.HELM_REPO_URL
     repo_name = repo_name or config.HELM_REPO_NAME
 
+    if not strict:
+        try:
+            versions = [entry['version'] for entry in _fetch_chart_entries(chart_name, repo_url, repo_name)]
+        except Exception:
+            pass  # Index unreachable; Helm's cached index may still answer
+        else:
+            if version:
+                return version if version in versions else None
+            return _latest_stable(versions)
+
     try:
-        # Ensure repository is added
-        check_repo_cmd = ["helm", "repo", "list", "-o", "json"]
+        # Ensure repository is added and up to date
         try:
-            repo_list = json.loads(subprocess.check_output(check_repo_cmd, stderr=subprocess.STDOUT).decode())
-            repos = [r.get("name", "") for r in repo_list]
-            if repo_name not in repos:
-                subprocess.check_call(
-                    ["helm", "repo", "add", repo_name, repo_url],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-            subprocess.check_call(
-                ["helm", "repo", "update", repo_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE
-            )
-        except (subprocess.CalledProcessError, json.JSONDecodeError):
-            try:
-                subprocess.check_call(
-                    ["helm", "repo", "add", repo_name, repo_url],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-                subprocess.check_call(
-                    ["helm", "repo", "update", repo_name],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-            except subprocess.CalledProcessError:
-                return None
+            _ensure_repo(repo_name, repo_url)
+        except subprocess.CalledProcessError:
+            return None
 
         # Get versions using helm search
-        versions_cmd = ["helm", "search", "repo", f"{repo_name}/{chart_name}", "--versions", "-o", "json"]
-        versions_output = subprocess.check_output(versions_cmd, stderr=subprocess.PIPE).decode()
-        versions_data = json.loads(versions_output)
+        versions_data = json.loads(
+            _helm("search", "repo", f"{repo_name}/{chart_name}", "--versions", "-o", "json", capture=True)
+        )
         if versions_data:
             if version:
                 # Check if specific version exists
@@ -150,17 +499,19 @@ def get_published_version(
 def get_published_versions(
     chart_name: Optional[str] = None,
     repo_url: Optional[str] = None,
-    repo_name: Optional[str] = None
+    repo_name: Optional[str] = None,
+    strict: bool = False
 ) -> List[str]:
     """
-    Get published versions using Helm command
+    Get published (non-pre-release) versions from the repository index
 
-    This function uses Helm command to get versions that are actually published and available.
+    These are the versions `helm search repo --versions` lists without `--devel`.
 
     Args:
         chart_name: Chart name, defaults to config.HELM_CHART_NAME
         repo_url: Helm Chart repository URL, defaults to config.HELM_REPO_URL
         repo_name: Repository name, defaults to config.HELM_REPO_NAME
+        strict: Ask Helm via `helm search repo` instead of reading index.yaml
 
     Returns:
         List of published versions (sorted, latest first)
@@ -170,58 +521,39 @@ def get_published_versions(
     repo_url = repo_url or config.HELM_REPO_URL
     repo_name = repo_name or config.HELM_REPO_NAME
 
+    if not strict:
+        pending = _take_prefetch(("index", repo_url, chart_name))
+        try:
+            if pending is not None:
+                chart_entries = pending.result(timeout=config.DOWNLOAD_TIMEOUT)
+            else:
+                chart_entries = _fetch_chart_entries(chart_name, repo_url, repo_name)
+        except Exception:
+            pass  # Index unreachable; Helm's cached index may still answer
+        else:
+            stable = {entry['version'] for entry in chart_entries if '-' not in entry['version']}
+            return sorted(stable, key=_version_key, reverse=True)
+
     versions = []
 
     try:
-        # Ensure repository is added
-        check_repo_cmd = ["helm", "repo", "list", "-o", "json"]
+        # Ensure repository is added and up to date
         try:
-            repo_list = json.loads(subprocess.check_output(check_repo_cmd, stderr=subprocess.STDOUT).decode())
-            repos = [r.get("name", "") for r in repo_list]
-            if repo_name not in repos:
-                subprocess.check_call(
-                    ["helm", "repo", "add", repo_name, repo_url],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-            subprocess.check_call(
-                ["helm", "repo", "update", repo_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE
-            )
-        except (subprocess.CalledProcessError, json.JSONDecodeError):
-            try:
-                subprocess.check_call(
-                    ["helm", "repo", "add", repo_name, repo_url],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-                subprocess.check_call(
-                    ["helm", "repo", "update", repo_name],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-            except subprocess.CalledProcessError:
-                return []
+            _ensure_repo(repo_name, repo_url)
+        except subprocess.CalledProcessError:
+            return []
 
         # Get versions using helm search
-        versions_cmd = ["helm", "search", "repo", f"{repo_name}/{chart_name}", "--versions", "-o", "json"]
-        versions_output = subprocess.check_output(versions_cmd, stderr=subprocess.PIPE).decode()
-        versions_data = json.loads(versions_output)
+        versions_data = json.loads(
+            _helm("search", "repo", f"{repo_name}/{chart_name}", "--versions", "-o", "json", capture=True)
+        )
         if versions_data:
             versions = [item.get("version", "") for item in versions_data if item.get("version")]
     except Exception:
         pass
 
     # Sort versions (semantic versioning, latest first)
-    def version_key(v):
-        try:
-            parts = v.split('.')
-            return tuple(int(p) if p.isdigit() else 0 for p in parts)
-        except:
-            return (0, 0, 0)
-
-    versions = sorted(set(versions), key=version_key, reverse=True)
+    versions = sorted(set(versions), key=_version_key, reverse=True)
     return versions
 
 
@@ -246,6 +578,9 @@ def prompt_helm_chart_version(
     repo_url = repo_url or config.HELM_REPO_URL
     repo_name = repo_name or config.HELM_REPO_NAME
 
+    # Fetch index.yaml while the user is reading the prompt
+    _start_prefetch(chart_name, repo_url, repo_name)
+
     # Prompt user to choose version source
     print_info("")
     version_source = prompt_choice(
@@ -270,6 +605,13 @@ def prompt_helm_chart_version(
     # Get the latest version (first in sorted list, which is already reverse sorted)
     latest_version = versions[0] if versions else None
 
+    # Most users accept the default, so start fetching its values.yaml while they read the list
+    # (unless get_or_download_values will answer it from the cache anyway)
+    values_key = ("values", repo_url, chart_name, latest_version)
+    latest_cached = (Path(config.CACHE_DIR) / f"values-{latest_version}.yaml").exists()
+    if values_key not in _PREFETCH and not latest_cached:
+        _PREFETCH[values_key] = _PREFETCH_POOL.submit(_fetch_values_direct, chart_name, repo_url, latest_version)
+
     # Prepare options with "Latest" showing actual version number
     # Format: "3.5.6 (latest version)" instead of just "latest version"
     if latest_version:
@@ -289,59 +631,50 @@ def prompt_helm_chart_version(
 
     # Display versions in reverse order (oldest to newest, with latest at the end)
     # Use reverse numbering: oldest version gets highest number, latest gets 1
-    print_info("")
-    print_info(_t('available_versions'))
     total_count = len(options)
 
-    # Display with reverse numbering
-    for i, option in enumerate(options, 1):
-        display_number = total_count - i + 1  # Reverse numbering: last item is 1
-        if i == total_count:  # Last item (latest version)
-            print_info(f"  {display_number}. {option} ({_t('recommended')}) [{_t('default')}]")
-        else:
-            print_info(f"  {display_number}. {option}")
+    # Display with reverse numbering (last item is 1), as one block
+    option_lines = [f"  {total_count - i}. {option}" for i, option in enumerate(other_versions)]
+    option_lines.append(f"  1. {latest_option} ({_t('recommended')}) [{_t('default')}]")
+    print_block("", _t('available_versions'), *option_lines)
 
     # Custom prompt for reverse numbering
-    # Map reverse display numbers to actual option indices
-    default_marker = _t('default')
-    select_text = _t('select_range')
-    if latest_option:
-        prompt_str = f"\n{select_text} [1-{total_count}] ({default_marker}: {latest_option}): "
-    else:
-        prompt_str = f"\n{select_text} [1-{total_count}]: "
+    # Display 1 -> last option (latest version), display total_count -> first option
+    prompt_str = f"\n{_t('select_range')} [1-{total_count}] ({_t('default')}: {latest_option}): "
+    error_msg = f"{_t('enter_number_range')} 1-{total_count}"
 
     while True:
         value = input(prompt_str).strip()
-        if not value and latest_option:
-            selected = latest_option
-            break
-
-        try:
-            display_num = int(value)
-            # Convert reverse display number to actual index
-            # Display 1 -> index total_count-1 (last item)
-            # Display total_count -> index 0 (first item)
-            actual_idx = total_count - display_num
-            if 0 <= actual_idx < len(options):
-                selected = options[actual_idx]
-                break
-        except ValueError:
-            pass
-
-        range_text = _t('enter_number_range')
-        from .colors import print_error
-        print_error(f"{range_text} 1-{total_count}")
-
-    # selected is already set above
-
-    # Check if user selected the latest option (with version number)
-    # If selected matches latest_option format, return the actual version number
-    if selected == latest_option:
-        # Return the actual latest version number, not None
-        # This ensures we use the exact version the user selected (e.g., 3.6.0-beta.1)
-        return latest_version
-    # Return the selected version (which is not the latest)
-    return selected
+        display_num = int(value) if value.isdecimal() else (1 if not value else 0)
+        if 1 <= display_num <= total_count:
+            # Display 1 is the labelled latest option; return its actual version number
+            # (e.g., 3.6.0-beta.1) rather than the option text
+            if display_num == 1:
+                return latest_version
+            # The speculative download has usually started by now and is left to finish unused
+            _take_prefetch(values_key)
+            return options[total_count - display_num]
+        print_error(error_msg)
+
+
+def _extract_chart_archive(archive: BinaryIO, extract_path: Path) -> None:
+    """Stream-extract a chart .tgz into extract_path, dropping its top-level `<chart>/` directory"""
+    import tarfile
+
+    # tarfile's "data" filter (Python 3.12, backported to 3.8.17+/3.11.4+) adds further checks
+    # where available; the regular-file/directory check below applies on every Python
+    extract_filter = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+    with tarfile.open(fileobj=archive, mode='r|gz') as tar:
+        for member in tar:
+            # Charts only ship files and directories; links and device/fifo members could
+            # redirect later writes outside extract_path, so they are never extracted
+            if not (member.isfile() or member.isdir()):
+                continue
+            parts = Path(member.name).parts[1:]
+            if not parts or member.name.startswith('/') or '..' in parts:
+                continue
+            member.name = str(Path(*parts))
+            tar.extract(member, extract_path, **extract_filter)
 
 
 def download_and_extract_chart(
@@ -369,46 +702,7 @@ def download_and_extract_chart(
     repo_url = repo_url or config.HELM_REPO_URL
     repo_name = repo_name or config.HELM_REPO_NAME
 
-    # Check if helm command is available
-    helm_available = shutil.which("helm") is not None
-    if not helm_available:
-        print_error(_t('helm_not_found'))
-        return None
-
     try:
-        # Ensure repository is added
-        check_repo_cmd = ["helm", "repo", "list", "-o", "json"]
-        try:
-            repo_list = json.loads(subprocess.check_output(check_repo_cmd, stderr=subprocess.STDOUT).decode())
-            repos = [r.get("name", "") for r in repo_list]
-            if repo_name not in repos:
-                print_info(f"{_t('adding_repo')}: {repo_name}")
-                subprocess.check_call(
-                    ["helm", "repo", "add", repo_name, repo_url],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-            subprocess.check_call(
-                ["helm", "repo", "update", repo_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE
-            )
-        except (subprocess.CalledProcessError, json.JSONDecodeError):
-            try:
-                subprocess.check_call(
-                    ["helm", "repo", "add", repo_name, repo_url],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-                subprocess.check_call(
-                    ["helm", "repo", "update", repo_name],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-            except subprocess.CalledProcessError as e:
-                print_error(f"{_t('add_repo_failed')}: {e}")
-                return None
-
         # Get actual version if not specified
         if not version:
             actual_version = get_published_version(chart_name, repo_url, repo_name)
@@ -438,69 +732,114 @@ def download_and_extract_chart(
                 print_info(_t('removing_existing_directory'))
                 shutil.rmtree(extract_path)
 
-        # Download chart using helm pull
+        # Download the chart archive directly, falling back to helm pull
         print_info(_t('downloading_chart'))
-        chart_ref = f"{repo_name}/{chart_name}"
-
-        # Use a temporary directory for extraction, then move to final location
-        import tempfile
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            helm_cmd = ["helm", "pull", chart_ref, "--version", version, "--untar", "--untardir", str(temp_path)]
-
-            try:
-                subprocess.check_call(
-                    helm_cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-
-                # Helm pull --untar extracts to {chart_name} directory (without version)
-                # Find the extracted directory
-                extracted_chart_dir = temp_path / chart_name
-                if not extracted_chart_dir.exists():
-                    # Try alternative naming: {chart_name}-{version}
-                    extracted_chart_dir = temp_path / f"{chart_name}-{version}"
-                if not extracted_chart_dir.exists():
-                    # Try to find any directory that was created
-                    extracted_dirs = [d for d in temp_path.iterdir() if d.is_dir()]
-                    if extracted_dirs:
-                        extracted_chart_dir = extracted_dirs[0]
-                    else:
-                        # List what's actually in temp directory for debugging
-                        actual_contents = list(temp_path.iterdir())
-                        print_error(f"{_t('chart_extract_error')}: Extracted directory not found in {temp_path}")
-                        print_error(f"Actual contents: {[str(p) for p in actual_contents]}")
-                        return None
-
-                # Remove target directory if exists
-                if extract_path.exists():
-                    shutil.rmtree(extract_path)
-                # Move extracted directory to final location
-                extracted_chart_dir.rename(extract_path)
-                print_success(f"{_t('chart_extracted_to')}: {extract_path}")
-                return str(extract_path)
+        downloaded = _download_chart_archive(chart_name, repo_url, version)
+        if downloaded:
+            archive = io.BytesIO(downloaded[0])
+        else:
+            archive = _pull_chart_with_helm(chart_name, repo_url, repo_name, version)
+        if archive is None:
+            return None
 
-            except subprocess.CalledProcessError as e:
-                # Get stderr for better error message
-                try:
-                    result = subprocess.run(
-                        helm_cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True
-                    )
-                    error_msg = result.stderr.strip() if result.stderr else str(e)
-                    print_error(f"{_t('chart_download_failed')}: {error_msg}")
-                except:
-                    print_error(f"{_t('chart_download_failed')}: {e}")
-                return None
+        # Remove target directory if exists, then extract straight to the final location
+        if extract_path.exists():
+            shutil.rmtree(extract_path)
+        _extract_chart_archive(archive, extract_path)
+        print_success(f"{_t('chart_extracted_to')}: {extract_path}")
+        return str(extract_path)
 
     except Exception as e:
         print_error(f"{_t('chart_extract_error')}: {e}")
         return None
 
 
+def _pull_chart_with_helm(chart_name: str, repo_url: str, repo_name: str, version: str) -> Optional[BinaryIO]:
+    """Download a chart archive with `helm pull` (fallback when the direct download fails)"""
+    # Check if helm command is available
+    if shutil.which("helm") is None:
+        print_error(_t('helm_not_found'))
+        return None
+
+    # Ensure repository is added and up to date
+    try:
+        _ensure_repo(repo_name, repo_url)
+    except subprocess.CalledProcessError as e:
+        print_error(f"{_t('add_repo_failed')}: {e}")
+        return None
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        try:
+            _helm("pull", f"{repo_name}/{chart_name}", "--version", version, "--destination", str(temp_path))
+        except subprocess.CalledProcessError as e:
+            # helm's stderr gives a better error message than the exit status
+            error_msg = e.stderr.strip() if e.stderr else str(e)
+            print_error(f"{_t('chart_download_failed')}: {error_msg}")
+            return None
+
+        archives = list(temp_path.glob("*.tgz"))
+        if not archives:
+            # List what's actually in temp directory for debugging
+            actual_contents = list(temp_path.iterdir())
+            print_error(f"{_t('chart_extract_error')}: Chart archive not found in {temp_path}")
+            print_error(f"Actual contents: {[str(p) for p in actual_contents]}")
+            return None
+        return io.BytesIO(archives[0].read_bytes())
+
+
+def _show_values_with_helm(
+    chart_name: str,
+    repo_url: str,
+    repo_name: str,
+    version: Optional[str] = None
+) -> tuple[str, Optional[str]]:
+    """
+    Get values.yaml using `helm pull` (fallback when the direct fetch fails)
+
+    Returns:
+        Tuple of (values.yaml content, chart version or None if unknown)
+
+    Raises:
+        SystemExit: If Helm is not installed or the repository cannot be added
+        subprocess.CalledProcessError: If the helm command fails
+    """
+    # Check if helm command is available
+    if shutil.which("helm") is None:
+        print_error(_t('helm_not_found'))
+        print_info("")
+        print_info(_t('install_helm'))
+        print_info(_t('install_helm_macos'))
+        print_info(_t('install_helm_linux'))
+        print_info(_t('install_helm_windows'))
+        print_info("")
+        print_info(_t('or_manual_download'))
+        sys.exit(1)
+
+    # Add repository if not exists and refresh its index
+    try:
+        _ensure_repo(repo_name, repo_url)
+    except subprocess.CalledProcessError as e:
+        print_error(f"{_t('add_repo_failed')}: {e}")
+        print_info(_t('check_network_repo_url'))
+        sys.exit(1)
+
+    import tarfile
+
+    # One pull yields both values.yaml and Chart.yaml, which names the resolved version;
+    # read just those two members instead of unpacking the whole chart
+    with tempfile.TemporaryDirectory() as temp_dir:
+        version_args = ("--version", version) if version else ()
+        _helm("pull", f"{repo_name}/{chart_name}", *version_args, "--destination", temp_dir)
+
+        archive = next(Path(temp_dir).glob("*.tgz"))
+        with tarfile.open(archive, mode='r:gz') as tar:
+            values_content = tar.extractfile(f"{chart_name}/values.yaml").read().decode('utf-8')
+            chart_meta = yaml.load(tar.extractfile(f"{chart_name}/Chart.yaml"), Loader=SafeLoader) or {}
+
+    return values_content, version or chart_meta.get('version')
+
+
 def download_values_from_helm_repo(
     chart_name: Optional[str] = None,
     repo_url: Optional[str] = None,
@@ -522,7 +861,7 @@ def download_values_from_helm_repo(
         Path to values.yaml file
 
     Raises:
-        SystemExit: If Helm is not installed or download fails
+        SystemExit: If the direct download fails and Helm is not installed or fails too
     """
     # Use global config defaults if not provided
     chart_name = chart_name or config.HELM_CHART_NAME
@@ -533,22 +872,7 @@ def download_values_from_helm_repo(
     cache_path = Path(cache_dir)
     cache_path.mkdir(exist_ok=True)
 
-    # Check if helm command is available
-    helm_available = shutil.which("helm") is not None
-
-    if not helm_available:
-        print_error(_t('helm_not_found'))
-        print_info("")
-        print_info(_t('install_helm'))
-        print_info(_t('install_helm_macos'))
-        print_info(_t('install_helm_linux'))
-        print_info(_t('install_helm_windows'))
-        print_info("")
-        print_info(_t('or_manual_download'))
-        sys.exit(1)
-
     try:
-        # Use helm show values to get values.yaml
         print_info(_t('downloading_from_repo'))
         print_info(f"{_t('repository')}: {repo_url}")
         if version:
@@ -556,69 +880,28 @@ def download_values_from_helm_repo(
         else:
             print_info(f"{_t('version')}: {_t('latest')}")
 
-        # Add repository if not exists
-        check_repo_cmd = ["helm", "repo", "list", "-o", "json"]
-        try:
-            repo_list = json.loads(subprocess.check_output(check_repo_cmd, stderr=subprocess.STDOUT).decode())
-            repos = [r.get("name", "") for r in repo_list]
-            if repo_name not in repos:
-                print_info(f"{_t('adding_repo')}: {repo_name}")
-                subprocess.check_call(
-                    ["helm", "repo", "add", repo_name, repo_url],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-                subprocess.check_call(
-                    ["helm", "repo", "update", repo_name],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-        except (subprocess.CalledProcessError, json.JSONDecodeError):
-            # If command fails, try adding repository
-            try:
-                subprocess.check_call(
-                    ["helm", "repo", "add", repo_name, repo_url],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-                subprocess.check_call(
-                    ["helm", "repo", "update", repo_name],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
-                )
-            except subprocess.CalledProcessError as e:
-                print_error(f"{_t('add_repo_failed')}: {e}")
-                print_info(_t('check_network_repo_url'))
-                sys.exit(1)
-
-        # Build helm show values command
-        chart_ref = f"{repo_name}/{chart_name}"
-
-        # Get values.yaml
+        # Get values.yaml, straight from the chart tarball when possible
         print_info(_t('getting_values'))
-        helm_cmd = ["helm", "show", "values", chart_ref]
-        if version:
-            helm_cmd.extend(["--version", version])
-
-        values_content = subprocess.check_output(
-            helm_cmd,
-            stderr=subprocess.PIPE
-        ).decode('utf-8')
+        pending = _take_prefetch(("values", repo_url, chart_name, version))
+        direct = pending.result() if pending is not None else _fetch_values_direct(chart_name, repo_url, version)
+        if direct:
+            values_content, actual_version = direct
+        else:
+            values_content, actual_version = _show_values_with_helm(chart_name, repo_url, repo_name, version)
 
         # Determine cache filename
         if version:
             cache_file = cache_path / f"values-{version}.yaml"
+        elif actual_version:
+            cache_file = cache_path / f"values-{actual_version}.yaml"
+            print_info(f"{_t('detected_version')}: {actual_version}")
         else:
-            # Get actual published version using Helm command
-            actual_version = get_published_version(chart_name, repo_url, repo_name)
-            if actual_version:
-                cache_file = cache_path / f"values-{actual_version}.yaml"
-                print_info(f"{_t('detected_version')}: {actual_version}")
-            else:
-                cache_file = cache_path / "values-latest.yaml"
+            cache_file = cache_path / "values-latest.yaml"
 
         # Save to cache file
         cache_file.write_text(values_content, encoding='utf-8')
+        if actual_version:
+            (cache_path / LAST_VERSION_FILE).write_text(actual_version, encoding='utf-8')
         print_success(f"{_t('saved_to')}: {cache_file}")
 
         return str(cache_file)
@@ -638,6 +921,28 @@ def download_values_from_helm_repo(
         sys.exit(1)
 
 
+def _read_last_version(cache_path: Path) -> Optional[str]:
+    """
+    Version of the most recent download, recorded in the cache directory
+
+    Caches written before the marker existed fall back to scanning cached file names.
+    """
+    try:
+        return (cache_path / LAST_VERSION_FILE).read_text(encoding='utf-8').strip() or None
+    except OSError:
+        pass
+    try:
+        with os.scandir(cache_path) as entries:
+            for entry in entries:
+                if entry.name.startswith("values-") and entry.name.endswith(".yaml"):
+                    match = _CACHED_VERSION_RE.match(entry.name)
+                    if match:
+                        return match.group(1)
+    except OSError:
+        pass
+    return None
+
+
 def get_or_download_values(
     version: Optional[str] = None,
     force_download: bool = False,
@@ -666,20 +971,8 @@ def get_or_download_values(
     local_values = Path(config.LOCAL_VALUES_FILE)
     if local_values.exists() and not force_download:
         print_info(f"{_t('using_local')}: {local_values}")
-        # Try to get version from cache or use latest
-        actual_version = None
-        cache_path = Path(config.CACHE_DIR)
-        # Check if we can find version from cache files
-        if cache_path.exists():
-            cache_files = list(cache_path.glob("values-*.yaml"))
-            if cache_files:
-                import re
-                for cf in cache_files:
-                    match = re.search(r'values-([\d.]+(?:-[a-zA-Z0-9.]+)?)\.yaml', cf.name)
-                    if match:
-                        actual_version = match.group(1)
-                        break
-        return str(local_values), actual_version
+        # Use the version recorded by the last download, if any
+        return str(local_values), _read_last_version(Path(config.CACHE_DIR))
 
     # Prompt for version selection if not specified
     selected_version = version
@@ -705,8 +998,7 @@ def get_or_download_values(
     # Extract actual version from downloaded file
     actual_version = selected_version
     if not actual_version:
-        import re
-        match = re.search(r'values-([\d.]+(?:-[a-zA-Z0-9.]+)?)\.yaml', source_file)
+        match = _CACHED_VERSION_RE.search(source_file)
         if match:
             actual_version = match.group(1)
 
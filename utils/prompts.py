@@ -26,6 +26,29 @@ def prompt(prompt_text: str, default: Optional[str] = None, required: bool = Tru
             print_error(_t('field_required'))
 
 
+def prompt_or_default(prompt_text: str, default: str) -> str:
+    """Prompt for optional input, returning default when left empty"""
+    return prompt(prompt_text, default=default, required=False) or default
+
+
+def prompt_int(prompt_text: str, default: int, required: bool = False) -> int:
+    """Prompt for an integer, falling back to default on invalid input"""
+    value = prompt(prompt_text, default=str(default), required=required)
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def prompt_float(prompt_text: str, default: float, required: bool = False) -> float:
+    """Prompt for a float, falling back to default on invalid input"""
+    value = prompt(prompt_text, default=str(default), required=required)
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
 def prompt_yes_no(prompt_text: str, default: bool = True) -> bool:
     """Prompt yes/no choice"""
     default_str = "Y/n" if default else "y/N"
@@ -51,13 +74,14 @@ def prompt_choice(prompt_text: str, choices: list, default: Optional[str] = None
         marker = f" [{default_marker}]" if choice == default else ""
         print(f"  {i}. {choice}{marker}")
 
-    while True:
-        select_text = _t('select_range')
-        if default:
-            prompt_str = f"{select_text} [1-{len(choices)}] ({default_marker}: {default}): "
-        else:
-            prompt_str = f"{select_text} [1-{len(choices)}]: "
+    select_text = _t('select_range')
+    if default:
+        prompt_str = f"{select_text} [1-{len(choices)}] ({default_marker}: {default}): "
+    else:
+        prompt_str = f"{select_text} [1-{len(choices)}]: "
+    error_msg = f"{_t('enter_number_range')} 1-{len(choices)}"
 
+    while True:
         value = input(prompt_str).strip()
         if not value and default:
             return default
@@ -69,6 +93,5 @@ def prompt_choice(prompt_text: str, choices: list, default: Optional[str] = None
         except ValueError:
             pass
 
-        range_text = _t('enter_number_range')
-        print_error(f"{range_text} 1-{len(choices)}")
+        print_error(error_msg)
 
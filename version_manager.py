@@ -1,20 +1,37 @@
 """Version management for Dify EE"""
 
+import re
 import sys
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 from utils import Colors, print_header, print_info, print_success, print_error, print_warning
 from i18n import get_translator
 
 _t = get_translator()
 
+# Leading major version number of a chart version ("3.5.6", "3.6.0-beta.1")
+_CHART_MAJOR_RE = re.compile(r"(\d+)")
+
+# Chart major version -> Dify EE version; chart 1.x maps to EE 2.x (legacy support)
+_CHART_MAJOR_TO_EE = {1: "2.x", 2: "2.x", 3: "3.x"}
+
+
+def _freeze_configs(configs: Dict[str, Dict[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    """Return a read-only view of version configs with module lists as tuples"""
+    return MappingProxyType({
+        version: MappingProxyType({**config, "modules": tuple(config.get("modules", ()))})
+        for version, config in configs.items()
+    })
+
 
 class VersionManager:
     """Version manager - manages Dify EE configuration modules for different versions"""
 
     # Version configuration: defines modules supported by each version
     # Uses major version format (3.x, 2.x) to avoid confusion with specific chart versions (e.g., 3.5.6)
-    VERSION_CONFIGS = {
+    # Frozen at class definition so callers can share it without copying
+    VERSION_CONFIGS = _freeze_configs({
         "3.x": {
             "name": "Dify Enterprise Edition 3.x",
             "modules": [
@@ -40,6 +57,19 @@ class VersionManager:
             "description": "Version without plugin support"
         },
         # More version configurations can be added here (e.g., "4.x")
+    })
+
+    # Module membership per version, built once for is_module_supported lookups
+    _MODULE_SETS = {version: frozenset(config["modules"]) for version, config in VERSION_CONFIGS.items()}
+
+    # Menu fields per version (name, description, comma-joined modules), built once
+    _MENU_FIELDS = {
+        version: (
+            config.get("name", f"Version {version}"),
+            config.get("description", ""),
+            ", ".join(config.get("modules", [])),
+        )
+        for version, config in VERSION_CONFIGS.items()
     }
 
     @classmethod
@@ -48,7 +78,7 @@ class VersionManager:
         return list(cls.VERSION_CONFIGS.keys())
 
     @classmethod
-    def get_version_info(cls, version: str) -> Optional[Dict[str, Any]]:
+    def get_version_info(cls, version: str) -> Optional[Mapping[str, Any]]:
         """Get version information"""
         return cls.VERSION_CONFIGS.get(version)
 
@@ -57,14 +87,30 @@ class VersionManager:
         """Get list of modules supported by version"""
         config = cls.get_version_info(version)
         if config:
-            return config.get("modules", [])
+            return list(config["modules"])
         return []
 
     @classmethod
     def is_module_supported(cls, version: str, module: str) -> bool:
         """Check if version supports a module"""
-        modules = cls.get_version_modules(version)
-        return module in modules
+        return module in cls._MODULE_SETS.get(version, ())
+
+    @classmethod
+    def _render_version_menu(cls) -> str:
+        """Render the numbered version list shown by prompt_version_selection"""
+        version_label = _t('version')
+        description_label = _t('description')
+        modules_label = _t('supported_modules')
+        lines = []
+        for i, version in enumerate(cls.get_available_versions(), 1):
+            name, description, modules_csv = cls._MENU_FIELDS[version]
+            lines.append(f"  {i}. {name}")
+            lines.append(f"     {version_label}: {version}")
+            if description:
+                lines.append(f"     {description_label}: {description}")
+            lines.append(f"     {modules_label}: {modules_csv}")
+            lines.append("")
+        return "\n".join(lines) + "\n"
 
     @classmethod
     def prompt_version_selection(cls) -> str:
@@ -74,42 +120,36 @@ class VersionManager:
         print()
 
         versions = cls.get_available_versions()
-        version_options = []
-
-        for i, version in enumerate(versions, 1):
-            config = cls.get_version_info(version)
-            name = config.get("name", f"Version {version}")
-            desc = config.get("description", "")
-            modules = config.get("modules", [])
-
-            print(f"  {i}. {name}")
-            print(f"     {_t('version')}: {version}")
-            if desc:
-                print(f"     {_t('description')}: {desc}")
-            print(f"     {_t('supported_modules')}: {', '.join(modules)}")
-            print()
+        print(cls._render_version_menu(), end="")
 
-            version_options.append(version)
+        # Build the prompt and error texts once rather than on every retry
+        prompt_str = (
+            f"{Colors.BOLD}{_t('select_version_range')} [1-{len(versions)}] ({_t('default')}: 1): {Colors.ENDC}"
+        )
+        range_error_msg = f"{_t('invalid_selection')} {_t('enter_number_range')} 1-{len(versions)}"
+        number_error_msg = _t('enter_valid_number')
+        # Canonical answers ("1", "2", ...) resolve by lookup; anything else goes through int()
+        choice_map = {str(i): version for i, version in enumerate(versions, 1)}
 
         while True:
             try:
-                default_text = _t('default')
-                choice = input(f"{Colors.BOLD}{_t('select_version_range')} [1-{len(versions)}] ({default_text}: 1): {Colors.ENDC}").strip()
+                choice = input(prompt_str).strip()
 
                 if not choice:
                     choice = "1"
 
-                idx = int(choice) - 1
-                if 0 <= idx < len(versions):
-                    selected_version = version_options[idx]
-                    config = cls.get_version_info(selected_version)
-                    print_success(f"{_t('selected')}: {config.get('name', selected_version)}")
-                    return selected_version
-                else:
-                    range_text = _t('enter_number_range')
-                    print_error(f"{_t('invalid_selection')} {range_text} 1-{len(versions)}")
+                selected_version = choice_map.get(choice)
+                if selected_version is None:
+                    idx = int(choice) - 1
+                    if not 0 <= idx < len(versions):
+                        print_error(range_error_msg)
+                        continue
+                    selected_version = versions[idx]
+                config = cls.get_version_info(selected_version)
+                print_success(f"{_t('selected')}: {config.get('name', selected_version)}")
+                return selected_version
             except ValueError:
-                print_error(_t('enter_valid_number'))
+                print_error(number_error_msg)
             except KeyboardInterrupt:
                 print("\n")
                 print_warning(_t('user_interrupted'))
@@ -141,28 +181,13 @@ class VersionManager:
         Returns:
             Dify EE version string (e.g., "3.x", "2.x") or None if cannot be determined
         """
-        if not chart_version:
-            return None
-
-        # Extract major version number
-        try:
-            # Handle versions like "3.5.6", "3.6.0-beta.1", etc.
-            major_version = int(chart_version.split('.')[0])
-
-            # Map major version to EE version (using x format for extensibility)
-            # Future versions (4.x, 5.x, etc.) will automatically map correctly
-            if major_version >= 4:
-                return f"{major_version}.x"
-            elif major_version >= 3:
-                return "3.x"
-            elif major_version >= 2:
-                return "2.x"
-            elif major_version >= 1:
-                # Chart version 1.x maps to EE 2.x (legacy support)
-                return "2.x"
-            else:
-                return None
-        except (ValueError, IndexError):
+        match = _CHART_MAJOR_RE.match(chart_version or "")
+        if not match:
             # If version format is unexpected, return None
             return None
 
+        # Future versions (4.x, 5.x, etc.) map to their own major version automatically
+        major_version = int(match.group(1))
+        if major_version >= 4:
+            return f"{major_version}.x"
+        return _CHART_MAJOR_TO_EE.get(major_version)